@@ -1,18 +1,34 @@
-from typing import Any
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from threading import Event
+from typing import Any, Iterable, Iterator
 from datetime import datetime, timezone
 
 from dagster import (
     AssetExecutionContext,
     AssetIn,
-    AssetKey,
-    FreshnessPolicy,
+    AssetsDefinition,
     MetadataValue,
     asset,
     get_dagster_logger, 
 )
 
 from .resources import GitHubAPIResource
-from .utils import create_markdown_report, extract_metadata, validate_repo_data 
+from .utils import (
+    ITEM_FIELDS,
+    count_items,
+    create_markdown_report,
+    extract_metadata,
+    summarize_items,
+    validate_repo_data,
+)
+
+
+def _iter_until(items: Iterable[Any], stop: Event) -> Iterator[Any]:
+    """Iterate over the items until the event is set, so no further pages are requested."""
+    for item in items:
+        if stop.is_set():
+            return
+        yield item
 
 
 def fetch_repo_data(github_api: GitHubAPIResource, owner: str, repo: str) -> dict[str, Any]:
@@ -28,7 +44,8 @@ def fetch_repo_data(github_api: GitHubAPIResource, owner: str, repo: str) -> dic
 
     Returns:
         - dict[str, Any]:
-            Dictionary containing all repository data.
+            Dictionary with the repository metadata, the number of releases,
+            and the summaries of the issues and pull requests (see `summarize_items`).
 
     Raises:
         - requests.HTTPError: When HTTP 4xx or 5xx response is received (propagated from GitHubAPIResource).
@@ -36,27 +53,63 @@ def fetch_repo_data(github_api: GitHubAPIResource, owner: str, repo: str) -> dic
     """
     logger = get_dagster_logger() # Using Dagster's Logger
     try:
-        # Fetch data using the GitHubAPIResource (which now handles retries and pagination internally)
-        repo_metadata = github_api.get_repository(owner=owner, repo=repo)
-        releases = github_api.get_releases(owner=owner, repo=repo)
-        issues = github_api.get_issues(owner=owner, repo=repo)
-        prs = github_api.get_pull_requests(owner=owner, repo=repo)
-
-        repo_data = {
-            'metadata': repo_metadata,
-            'releases': releases,
-            'issues': issues,
-            'prs': prs,
-        }
+        if github_api.use_graphql:
+            # One GraphQL query returns the metadata, the numbers of releases and open items, and the first page
+            # of closed items. Only the closed items are needed to calculate the average days until closed.
+            summary = github_api.get_repository_summary_graphql(owner=owner, repo=repo)
+            repo_data = {
+                'metadata': summary['metadata'],
+                'releases': summary['releases'],
+                'issues': {
+                    **summarize_items(summary['closed_issues'], section='issues'),
+                    'open': summary['open_issues'],
+                },
+                'prs': {
+                    **summarize_items(summary['closed_prs'], section='prs'),
+                    'open': summary['open_prs'],
+                },
+            }
+        else:
+            # The four endpoints are independent, so request them concurrently. The asset then takes as long as
+            # the slowest call instead of the sum of all calls (GitHubAPIResource handles retries and pagination).
+            # The items are reduced to the fields of the report as soon as a page is parsed,
+            # then validated and aggregated to the numbers of the report while the pages arrive.
+            failed = Event()
+            releases = github_api.iter_releases(owner=owner, repo=repo, fields=ITEM_FIELDS['releases'])
+            issues = github_api.iter_issues(owner=owner, repo=repo, fields=ITEM_FIELDS['issues'])
+            prs = github_api.iter_pull_requests(owner=owner, repo=repo, fields=ITEM_FIELDS['prs'])
+            try:
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    futures = {
+                        'metadata': executor.submit(github_api.get_repository, owner=owner, repo=repo),
+                        'releases': executor.submit(count_items, _iter_until(releases, failed), section='releases'),
+                        'issues': executor.submit(summarize_items, _iter_until(issues, failed), section='issues'),
+                        'prs': executor.submit(summarize_items, _iter_until(prs, failed), section='prs'),
+                    }
+
+                    # Fail fast: the first error, e.g. a requests.HTTPError or the first invalid item,
+                    # stops the pagination of the other sections instead of waiting for all their pages
+                    done, _ = wait(futures.values(), return_when=FIRST_EXCEPTION)
+                    error = next((future.exception() for future in done if future.exception() is not None), None)
+                    if error is not None:
+                        failed.set()
+                        raise error
+
+                    repo_data = {section: future.result() for section, future in futures.items()}
+            finally:
+                # All sections stopped consuming items when the executor shut down. Closing their generators
+                # also cancels the pages which were already requested ahead (see `GitHubAPIResource._get_pages`).
+                for items in (releases, issues, prs):
+                    items.close()
 
         # Validate the collected data structure and content
         validate_repo_data(repo_data)
 
         # Log metrics about the collected data
         logger.info(f"Collected data for {owner}/{repo}:")
-        logger.info(f"- {len(releases)} releases")
-        logger.info(f"- {len(issues)} issues")
-        logger.info(f"- {len(prs)} pull requests")
+        logger.info(f"- {repo_data['releases']} releases")
+        logger.info(f"- {repo_data['issues']['open'] + repo_data['issues']['closed']} issues")
+        logger.info(f"- {repo_data['prs']['open'] + repo_data['prs']['closed']} pull requests")
 
         return repo_data
     except Exception as e:
@@ -65,88 +118,69 @@ def fetch_repo_data(github_api: GitHubAPIResource, owner: str, repo: str) -> dic
         raise # Re-raise the exception to propagate the asset failure
 
 
-@asset(
-    name='delta-rs_repo_metadata',
-    key_prefix=['stage', 'github', 'repositories', 'delta-io', 'delta-rs'],
-    io_manager_key='json_io_manager',
-    group_name='github',
-    freshness_policy=FreshnessPolicy(maximum_lag_minutes=60 * 24),  # 24 hours
-)
-def delta_rs_metadata(context: AssetExecutionContext, github_api: GitHubAPIResource) -> dict[str, Any]:
-    """Metadata from the GitHub repository of the Delta Lake Python client."""
-    repo_data = fetch_repo_data(github_api=github_api, owner='delta-io', repo='delta-rs')
-
-    context.add_output_metadata(
-        metadata={
-            'repo link': MetadataValue.url(repo_data['metadata'].get('html_url')),
-            'data preview': MetadataValue.json(repo_data['metadata']),
-        }
-    )
+# Repositories of the report: (account owner, repository name, description of the repository)
+REPOSITORIES = [
+    ('delta-io', 'delta-rs', 'Delta Lake Python client'),
+    ('apache', 'iceberg-python', 'Iceberg Python client'),
+    ('apache', 'hudi-rs', 'Hudi Rust client'),
+]
 
-    return repo_data
 
+def make_repo_metadata_asset(owner: str, repo: str, description: str) -> AssetsDefinition:
+    """Create the metadata asset for a GitHub repository.
 
-@asset(
-    name='iceberg-python_repo_metadata',
-    key_prefix=['stage', 'github', 'repositories', 'apache', 'iceberg-python'],
-    io_manager_key='json_io_manager',
-    group_name='github',
-    freshness_policy=FreshnessPolicy(maximum_lag_minutes=60 * 24),  # 24 hours
-)
-def iceberg_python_metadata(context: AssetExecutionContext, github_api: GitHubAPIResource) -> dict[str, Any]:
-    """Metadata from the GitHub repository of the Iceberg Python client."""
-    repo_data = fetch_repo_data(github_api=github_api, owner='apache', repo='iceberg-python')
-
-    context.add_output_metadata(
-        metadata={
-            'repo link': MetadataValue.url(repo_data['metadata'].get('html_url')),
-            'data preview': MetadataValue.json(repo_data['metadata']),
-        }
+    Args:
+        - owner (str):
+            The account owner of the repository.
+        - repo (str):
+            The name of the repository.
+        - description (str):
+            Short description of the repository for the asset description.
+
+    Returns:
+        - AssetsDefinition:
+            Asset '<repo>_repo_metadata' with the data from `fetch_repo_data`.
+    """
+    @asset(
+        name=f'{repo}_repo_metadata',
+        key_prefix=['stage', 'github', 'repositories', owner, repo],
+        io_manager_key='json_io_manager',
+        group_name='github',
+        description=f'Metadata from the GitHub repository of the {description}.',
     )
+    def repo_metadata(context: AssetExecutionContext, github_api: GitHubAPIResource) -> dict[str, Any]:
+        repo_data = fetch_repo_data(github_api=github_api, owner=owner, repo=repo)
 
-    return repo_data
+        # The stored data is linked by the 'uri' metadata of the S3 IO manager,
+        # so it is not serialized into the run events a second time
+        context.add_output_metadata(
+            metadata={
+                'repo link': MetadataValue.url(repo_data['metadata'].get('html_url')),
+            }
+        )
 
+        return repo_data
+
+    return repo_metadata
 
-@asset(
-    name='hudi-rs_repo_metadata',
-    key_prefix=['stage', 'github', 'repositories', 'apache', 'hudi-rs'],
-    io_manager_key='json_io_manager',
-    group_name='github',
-    freshness_policy=FreshnessPolicy(maximum_lag_minutes=60 * 24),  # 24 hours
-)
-def hudi_rs_metadata(context: AssetExecutionContext, github_api: GitHubAPIResource) -> dict[str, Any]:
-    """Metadata from the GitHub repository of the Hudi Rust client.""" # Corrected docstring
-    repo_data = fetch_repo_data(github_api=github_api, owner='apache', repo='hudi-rs')
-
-    context.add_output_metadata(
-        metadata={
-            'repo link': MetadataValue.url(repo_data['metadata'].get('html_url')),
-            'data preview': MetadataValue.json(repo_data['metadata']),
-        }
-    )
 
-    return repo_data
+repo_metadata_assets = [make_repo_metadata_asset(owner, repo, description) for owner, repo, description in REPOSITORIES]
 
 
 @asset(
     key_prefix=['dm', 'reports'],
     ins={
-        'delta_rs': AssetIn(AssetKey('delta-rs_repo_metadata')),
-        'iceberg_python': AssetIn(AssetKey('iceberg-python_repo_metadata')),
-        'hudi_rs': AssetIn(AssetKey('hudi-rs_repo_metadata')),
+        repo.replace('-', '_'): AssetIn(repo_metadata_asset.key)
+        for (_, repo, _), repo_metadata_asset in zip(REPOSITORIES, repo_metadata_assets)
     },
     io_manager_key='md_io_manager',
     group_name='github',
 )
-def repo_report(
-    context: AssetExecutionContext, delta_rs: dict[str, Any], iceberg_python: dict[str, Any], hudi_rs: dict[str, Any]
-) -> str:
+def repo_report(context: AssetExecutionContext, **repo_metadata: dict[str, Any]) -> str:
     """Report for comparing GitHub repositories."""
 
     report_data = {
-        'delta-rs': extract_metadata(repo_metadata=delta_rs), # Corrected typo from repo_matadata
-        'iceberg-python': extract_metadata(repo_metadata=iceberg_python), # Corrected typo from repo_matadata
-        'hudi-rs': extract_metadata(repo_metadata=hudi_rs), # Corrected typo from repo_matadata
+        repo: extract_metadata(repo_metadata=repo_metadata[repo.replace('-', '_')]) for _, repo, _ in REPOSITORIES
     }
 
     return create_markdown_report(context=context, report_data=report_data)
@@ -2,8 +2,10 @@ from dagster import (
     AssetSelection,
     Definitions,
     EnvVar,
+    ScheduleDefinition,
     define_asset_job,
     load_assets_from_modules,
+    multiprocess_executor,
 )
 from dagster_aws.s3 import s3_resource
 import os
@@ -20,11 +22,28 @@ all_assets = load_assets_from_modules([assets])
 # Job for retrieving GitHub statistics
 github_job = define_asset_job(name='refresh_repository_report', selection=AssetSelection.all())
 
+# A single daily run refreshes all repositories together (replaces a freshness policy per repository asset)
+github_schedule = ScheduleDefinition(job=github_job, cron_schedule='@daily')
+
+# The repository metadata assets are independent and network-bound, so they are materialized in parallel.
+# Keep `max_concurrent` small: all steps share the same token and GitHub's secondary rate limits
+# penalize bursts of concurrent requests (see README, section 3.3).
+executor = multiprocess_executor.configured({'max_concurrent': 4})
+
 defs = Definitions(
     assets=all_assets,
     jobs=[github_job],
+    schedules=[github_schedule],
+    executor=executor,
     resources={
-        'github_api': GitHubAPIResource(github_token=EnvVar('GITHUB_TOKEN').get_value()),
+        'github_api': GitHubAPIResource(
+            github_token=EnvVar('GITHUB_TOKEN').get_value(),
+            # Optional: several comma-separated tokens, which are used in turns
+            github_tokens=[
+                token.strip() for token in EnvVar('GITHUB_TOKENS').get_value(default='').split(',') if token.strip()
+            ],
+            response_cache_dir=EnvVar('GITHUB_RESPONSE_CACHE_DIR').get_value(),
+        ),
         'json_io_manager': s3_io_manager.configured(
             {'data_type': 'json', 's3_bucket': EnvVar('S3_BUCKET_NAME').get_value()}
         ),
@@ -1,8 +1,8 @@
 import datetime
 import io
-import json
 from typing import TYPE_CHECKING, Any
 
+import orjson
 from dagster import (
     InitResourceContext,
     InputContext,
@@ -53,11 +53,11 @@ class JsonObjectS3IOManager(PickledObjectS3IOManager):
         try:
             s3_client: 'S3Client' = self.s3
             s3_obj = s3_client.get_object(Bucket=self.bucket, Key=path.as_posix())
-            json_object = json.load(s3_obj['Body'])
+            json_object = orjson.loads(s3_obj['Body'].read())
             return json_object
         except s3_client.exceptions.NoSuchKey:
             raise FileNotFoundError(f'Could not find file {path} in S3 bucket {self.bucket}')
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise ValueError(f'File {path} in S3 bucket {self.bucket} does not contain valid JSON. Message: {e.msg}')
 
     def dump_to_path(self, context: OutputContext, obj: Any, path: UPath) -> None:
@@ -75,7 +75,8 @@ class JsonObjectS3IOManager(PickledObjectS3IOManager):
             - TypeError: When passed `obj` is not JSON serializable.
         """
         s3_client: 'S3Client' = self.s3
-        json_bytes = json.dumps(obj).encode('utf-8')
+        # orjson serializes directly to compact UTF-8 bytes and is considerably faster than the standard library
+        json_bytes = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
         # save normal json file (which gets overwritten on every dagster run)
         with io.BytesIO(json_bytes) as fp:
             s3_client.upload_fileobj(
@@ -4,9 +4,16 @@ This module provides mock data and functionality that can be used
 with the GitHubAPIResource class for testing and development.
 """
 
-from typing import Any, Dict, List
+from collections.abc import Sequence
+from typing import Any, Dict
 import logging
 
+try:
+    from github_pipeline.mock_items import ChainedItems, RepeatedItems
+except ImportError:
+    # When the module is imported from within the package directory, e.g. by test_mock_import.py
+    from mock_items import ChainedItems, RepeatedItems
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -27,7 +34,7 @@ class MockGitHubData:
         "html_url": "https://github.com/delta-io/delta-rs"
     }
     
-    DELTA_RS_RELEASES = [
+    DELTA_RS_RELEASES = RepeatedItems(
         {
             "id": 1,
             "tag_name": "v0.15.0",
@@ -35,10 +42,11 @@ class MockGitHubData:
             "body": "New features and improvements",
             "created_at": "2023-01-01T00:00:00Z",
             "published_at": "2023-01-01T00:00:00Z"
-        }
-    ] * 89  # 89 releases
+        },
+        count=89,  # 89 releases
+    )
     
-    DELTA_RS_ISSUES = [
+    DELTA_RS_ISSUES = RepeatedItems(
         {
             "id": 1,
             "number": 100,
@@ -47,10 +55,11 @@ class MockGitHubData:
             "body": "We need to optimize the read performance",
             "created_at": "2023-01-01T00:00:00Z",
             "updated_at": "2023-01-01T00:00:00Z"
-        }
-    ] * 139  # 139 open issues
+        },
+        count=139,  # 139 open issues
+    )
     
-    DELTA_RS_CLOSED_ISSUES = [
+    DELTA_RS_CLOSED_ISSUES = RepeatedItems(
         {
             "id": 2,
             "number": 101,
@@ -60,8 +69,9 @@ class MockGitHubData:
             "created_at": "2023-01-01T00:00:00Z",
             "closed_at": "2023-05-15T00:00:00Z",
             "updated_at": "2023-05-15T00:00:00Z"
-        }
-    ] * 1130  # 1130 closed issues
+        },
+        count=1130,  # 1130 closed issues
+    )
     
     # Data for iceberg-python repository with validation errors
     ICEBERG_PYTHON_REPO = {
@@ -78,7 +88,7 @@ class MockGitHubData:
         "html_url": None  # Missing URL
     }
     
-    ICEBERG_PYTHON_RELEASES = [
+    ICEBERG_PYTHON_RELEASES = RepeatedItems(
         {
             "id": 0,  # Invalid ID (zero)
             "tag_name": "",  # Empty tag
@@ -86,10 +96,11 @@ class MockGitHubData:
             "body": {"changes": ["not", "a", "string"]},  # Should be string
             "created_at": "invalid-date",  # Invalid date
             "published_at": "2023-02-31T00:00:00Z"  # Invalid date (Feb 31)
-        }
-    ] * 10  # 10 releases
+        },
+        count=10,  # 10 releases
+    )
     
-    ICEBERG_PYTHON_ISSUES = [
+    ICEBERG_PYTHON_ISSUES = RepeatedItems(
         {
             "id": 2147483648,  # Integer overflow
             "number": -500,  # Negative number
@@ -98,10 +109,11 @@ class MockGitHubData:
             "body": b"Binary data",  # Binary instead of string
             "created_at": "2023/01/01",  # Wrong date format
             "updated_at": ""  # Empty date
-        }
-    ] * 151  # 151 open issues
+        },
+        count=151,  # 151 open issues
+    )
     
-    ICEBERG_PYTHON_CLOSED_ISSUES = [
+    ICEBERG_PYTHON_CLOSED_ISSUES = RepeatedItems(
         {
             "id": float('inf'),  # Invalid number
             "number": None,  # Missing number
@@ -111,8 +123,9 @@ class MockGitHubData:
             "created_at": "2023-01-01 00:00:00",  # Wrong format (missing T and Z)
             "closed_at": "ongoing",  # Invalid date
             "updated_at": "2023-01-01T00:00:00Z\0"  # Null byte in date
-        }
-    ] * 431  # 431 closed issues
+        },
+        count=431,  # 431 closed issues
+    )
     
     HUDI_RS_REPO = {
         "id": 456789123,
@@ -128,7 +141,7 @@ class MockGitHubData:
         "html_url": "https://github.com/apache/hudi-rs"
     }
     
-    HUDI_RS_RELEASES = [
+    HUDI_RS_RELEASES = RepeatedItems(
         {
             "id": 5,
             "tag_name": "v0.1.0",
@@ -136,10 +149,11 @@ class MockGitHubData:
             "body": "Initial release",
             "created_at": "2023-01-01T00:00:00Z",
             "published_at": "2023-01-01T00:00:00Z"
-        }
-    ] * 3  # 3 releases
+        },
+        count=3,  # 3 releases
+    )
     
-    HUDI_RS_ISSUES = [
+    HUDI_RS_ISSUES = RepeatedItems(
         {
             "id": 6,
             "number": 300,
@@ -148,10 +162,11 @@ class MockGitHubData:
             "body": "Propose new enhancement",
             "created_at": "2023-01-01T00:00:00Z",
             "updated_at": "2023-01-01T00:00:00Z"
-        }
-    ] * 28  # 28 open issues
+        },
+        count=28,  # 28 open issues
+    )
     
-    HUDI_RS_CLOSED_ISSUES = [
+    HUDI_RS_CLOSED_ISSUES = RepeatedItems(
         {
             "id": 7,
             "number": 301,
@@ -161,12 +176,13 @@ class MockGitHubData:
             "created_at": "2023-01-01T00:00:00Z",
             "closed_at": "2023-02-15T00:00:00Z",
             "updated_at": "2023-02-15T00:00:00Z"
-        }
-    ] * 62  # 62 closed issues
+        },
+        count=62,  # 62 closed issues
+    )
     
     # Pull request data for each repository
     DELTA_RS_PRS = {
-        "open": [
+        "open": RepeatedItems(
             {
                 "id": 8,
                 "number": 400,
@@ -175,9 +191,10 @@ class MockGitHubData:
                 "body": "Implementing new feature",
                 "created_at": "2023-01-01T00:00:00Z",
                 "updated_at": "2023-01-01T00:00:00Z"
-            }
-        ] * 17,  # 17 open PRs
-        "closed": [
+            },
+            count=17,  # 17 open PRs
+        ),
+        "closed": RepeatedItems(
             {
                 "id": 9,
                 "number": 401,
@@ -187,12 +204,13 @@ class MockGitHubData:
                 "created_at": "2023-01-01T00:00:00Z",
                 "closed_at": "2023-01-10T00:00:00Z",
                 "updated_at": "2023-01-10T00:00:00Z"
-            }
-        ] * 1973  # 1973 closed PRs
+            },
+            count=1973,  # 1973 closed PRs
+        )
     }
     
     ICEBERG_PYTHON_PRS = {
-        "open": [
+        "open": RepeatedItems(
             {
                 "id": 10,
                 "number": 500,
@@ -201,9 +219,10 @@ class MockGitHubData:
                 "body": "Adding new feature",
                 "created_at": "2023-01-01T00:00:00Z",
                 "updated_at": "2023-01-01T00:00:00Z"
-            }
-        ] * 76,  # 76 open PRs
-        "closed": [
+            },
+            count=76,  # 76 open PRs
+        ),
+        "closed": RepeatedItems(
             {
                 "id": 11,
                 "number": 501,
@@ -213,12 +232,13 @@ class MockGitHubData:
                 "created_at": "2023-01-01T00:00:00Z",
                 "closed_at": "2023-01-09T00:00:00Z",
                 "updated_at": "2023-01-09T00:00:00Z"
-            }
-        ] * 1292  # 1292 closed PRs
+            },
+            count=1292,  # 1292 closed PRs
+        )
     }
     
     HUDI_RS_PRS = {
-        "open": [
+        "open": RepeatedItems(
             {
                 "id": 12,
                 "number": 600,
@@ -227,9 +247,10 @@ class MockGitHubData:
                 "body": "Adding enhancement",
                 "created_at": "2023-01-01T00:00:00Z",
                 "updated_at": "2023-01-01T00:00:00Z"
-            }
-        ] * 13,  # 13 open PRs
-        "closed": [
+            },
+            count=13,  # 13 open PRs
+        ),
+        "closed": RepeatedItems(
             {
                 "id": 13,
                 "number": 601,
@@ -239,8 +260,9 @@ class MockGitHubData:
                 "created_at": "2023-01-01T00:00:00Z",
                 "closed_at": "2023-01-09T00:00:00Z",
                 "updated_at": "2023-01-09T00:00:00Z"
-            }
-        ] * 222  # 222 closed PRs
+            },
+            count=222,  # 222 closed PRs
+        )
     }
 
 class MockGitHubAPI:
@@ -264,9 +286,18 @@ class MockGitHubAPI:
                 "apache/hudi-rs": MockGitHubData.HUDI_RS_RELEASES
             },
             "issues": {
-                "delta-io/delta-rs": MockGitHubData.DELTA_RS_ISSUES + MockGitHubData.DELTA_RS_CLOSED_ISSUES,
-                "apache/iceberg-python": MockGitHubData.ICEBERG_PYTHON_ISSUES + MockGitHubData.ICEBERG_PYTHON_CLOSED_ISSUES,
-                "apache/hudi-rs": MockGitHubData.HUDI_RS_ISSUES + MockGitHubData.HUDI_RS_CLOSED_ISSUES
+                "delta-io/delta-rs": {
+                    "open": MockGitHubData.DELTA_RS_ISSUES,
+                    "closed": MockGitHubData.DELTA_RS_CLOSED_ISSUES
+                },
+                "apache/iceberg-python": {
+                    "open": MockGitHubData.ICEBERG_PYTHON_ISSUES,
+                    "closed": MockGitHubData.ICEBERG_PYTHON_CLOSED_ISSUES
+                },
+                "apache/hudi-rs": {
+                    "open": MockGitHubData.HUDI_RS_ISSUES,
+                    "closed": MockGitHubData.HUDI_RS_CLOSED_ISSUES
+                }
             },
             "pull_requests": {
                 "delta-io/delta-rs": MockGitHubData.DELTA_RS_PRS,
@@ -282,7 +313,8 @@ class MockGitHubAPI:
             owner (str): Repository owner
             repo (str): Repository name
             data_type (str): Type of data ('repositories', 'releases', 'issues', or 'pull_requests')
-            data (Any): Mock data to set
+            data (Any): Mock data to set. Issues and pull requests are set as a dictionary
+                with the lists of 'open' and 'closed' items.
         """
         repo_full_name = f"{owner}/{repo}"
         if data_type not in self._data:
@@ -300,29 +332,32 @@ class MockGitHubAPI:
             "full_name": repo_full_name
         })
     
-    def get_releases(self, owner: str, repo: str) -> List[Dict[str, Any]]:
+    def get_releases(self, owner: str, repo: str) -> Sequence[Dict[str, Any]]:
         """Get mock repository releases."""
         repo_full_name = f"{owner}/{repo}"
         logger.debug(f"Mock: Getting releases for {repo_full_name}")
         return self._data["releases"].get(repo_full_name, MockGitHubData.DELTA_RS_RELEASES)
     
-    def get_issues(self, owner: str, repo: str, state: str = 'all') -> List[Dict[str, Any]]:
+    def get_issues(self, owner: str, repo: str, state: str = 'all') -> Sequence[Dict[str, Any]]:
         """Get mock repository issues."""
         repo_full_name = f"{owner}/{repo}"
         logger.debug(f"Mock: Getting issues for {repo_full_name}")
-        all_issues = self._data["issues"].get(repo_full_name, 
-            MockGitHubData.DELTA_RS_ISSUES + MockGitHubData.DELTA_RS_CLOSED_ISSUES)
+        issues_data = self._data["issues"].get(repo_full_name, {
+            "open": MockGitHubData.DELTA_RS_ISSUES,
+            "closed": MockGitHubData.DELTA_RS_CLOSED_ISSUES
+        })
         
-        if state != 'all':
-            return [issue for issue in all_issues if issue['state'] == state]
-        return all_issues
+        # Issues are stored by state, so no filtering is needed
+        if state == 'all':
+            return ChainedItems(issues_data['open'], issues_data['closed'])
+        return issues_data.get(state, [])
     
-    def get_pull_requests(self, owner: str, repo: str, state: str = 'all') -> List[Dict[str, Any]]:
+    def get_pull_requests(self, owner: str, repo: str, state: str = 'all') -> Sequence[Dict[str, Any]]:
         """Get mock repository pull requests."""
         repo_full_name = f"{owner}/{repo}"
         logger.debug(f"Mock: Getting pull requests for {repo_full_name}")
         prs_data = self._data["pull_requests"].get(repo_full_name, MockGitHubData.DELTA_RS_PRS)
         
         if state == 'all':
-            return prs_data['open'] + prs_data['closed']
-        return prs_data.get(state, []) 
+            return ChainedItems(prs_data['open'], prs_data['closed'])
+        return prs_data.get(state, [])
@@ -0,0 +1,82 @@
+"""Read-only sequences for the mock data of the GitHub API.
+
+They are shared by `mock_github.py` and its variants in `mocks/`, so large mock lists are neither built when the
+mock data is defined nor when the mock API returns it.
+"""
+
+from collections.abc import Sequence
+from itertools import chain, repeat
+from types import MappingProxyType
+from typing import Any, Dict, Iterator
+
+
+class RepeatedItems(Sequence):
+    """Read-only mock list, which contains the same item `count` times.
+
+    Only a read-only prototype of the item and the count are stored, so no list with `count` entries is built,
+    neither when the mock data is defined nor when the mock API returns it. Every entry is a new plain dict copied
+    from the prototype when it is accessed, so entries behave like the dicts of the real API (e.g. they can be
+    serialized to JSON) and changes by the caller never reach the shared mock data.
+
+    Args:
+        - prototype (Dict[str, Any]):
+            The item, which is repeated.
+        - count (int):
+            Number of items in the list.
+    """
+
+    def __init__(self, prototype: Dict[str, Any], count: int):
+        """Store a read-only view of the prototype and the number of items."""
+        self.prototype = MappingProxyType(prototype)
+        self.count = count
+
+    def __len__(self) -> int:
+        """Get the number of items."""
+        return self.count
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over copies of the prototype without building a list."""
+        return (dict(prototype) for prototype in repeat(self.prototype, self.count))
+
+    def __getitem__(self, index):
+        """Get the item at an index, or the items of a slice as a new `RepeatedItems`."""
+        if isinstance(index, slice):
+            return RepeatedItems(dict(self.prototype), len(range(*index.indices(self.count))))
+        if not -self.count <= index < self.count:
+            raise IndexError('RepeatedItems index out of range')
+        return dict(self.prototype)
+
+
+class ChainedItems(Sequence):
+    """Read-only concatenation of item lists, which does not copy the lists.
+
+    Used for the state 'all' of issues and pull requests, which are stored separately for 'open' and 'closed'.
+
+    Args:
+        - *parts (Sequence[Dict[str, Any]]):
+            Item lists, which are concatenated in the given order.
+    """
+
+    def __init__(self, *parts: Sequence[Dict[str, Any]]):
+        """Store references to the item lists."""
+        self.parts = parts
+
+    def __len__(self) -> int:
+        """Get the total number of items of all lists."""
+        return sum(len(part) for part in self.parts)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over the items of all lists in order."""
+        return chain.from_iterable(self.parts)
+
+    def __getitem__(self, index):
+        """Get the item at an index, or the items of a slice as a list."""
+        if isinstance(index, slice):
+            return list(self)[index]
+        if index < 0:
+            index += len(self)
+        for part in self.parts:
+            if 0 <= index < len(part):
+                return part[index]
+            index -= len(part)
+        raise IndexError('ChainedItems index out of range')
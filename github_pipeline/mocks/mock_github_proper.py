@@ -4,9 +4,16 @@ This module provides mock data and functionality that can be used
 with the GitHubAPIResource class for testing and development.
 """
 
-from typing import Any, Dict, List
+from collections.abc import Sequence
+from typing import Any, Dict
 import logging
 
+try:
+    from github_pipeline.mock_items import ChainedItems, RepeatedItems
+except ImportError:
+    # When the module is imported from within the package directory, e.g. by test_mock_import.py
+    from mock_items import ChainedItems, RepeatedItems
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -27,7 +34,7 @@ class MockGitHubData:
         "html_url": "https://github.com/delta-io/delta-rs"
     }
     
-    DELTA_RS_RELEASES = [
+    DELTA_RS_RELEASES = RepeatedItems(
         {
             "id": 1,
             "tag_name": "v0.15.0",
@@ -35,10 +42,11 @@ class MockGitHubData:
             "body": "New features and improvements",
             "created_at": "2023-01-01T00:00:00Z",
             "published_at": "2023-01-01T00:00:00Z"
-        }
-    ] * 89  # 89 releases
+        },
+        count=89,  # 89 releases
+    )
     
-    DELTA_RS_ISSUES = [
+    DELTA_RS_ISSUES = RepeatedItems(
         {
             "id": 1,
             "number": 100,
@@ -47,10 +55,11 @@ class MockGitHubData:
             "body": "We need to optimize the read performance",
             "created_at": "2023-01-01T00:00:00Z",
             "updated_at": "2023-01-01T00:00:00Z"
-        }
-    ] * 139  # 139 open issues
+        },
+        count=139,  # 139 open issues
+    )
     
-    DELTA_RS_CLOSED_ISSUES = [
+    DELTA_RS_CLOSED_ISSUES = RepeatedItems(
         {
             "id": 2,
             "number": 101,
@@ -60,8 +69,9 @@ class MockGitHubData:
             "created_at": "2023-01-01T00:00:00Z",
             "closed_at": "2023-05-15T00:00:00Z",
             "updated_at": "2023-05-15T00:00:00Z"
-        }
-    ] * 1130  # 1130 closed issues
+        },
+        count=1130,  # 1130 closed issues
+    )
     
     ICEBERG_PYTHON_REPO = {
         "id": 987654321,
@@ -77,7 +87,7 @@ class MockGitHubData:
         "html_url": "https://github.com/apache/iceberg-python"
     }
     
-    ICEBERG_PYTHON_RELEASES = [
+    ICEBERG_PYTHON_RELEASES = RepeatedItems(
         {
             "id": 2,
             "tag_name": "v1.0.0",
@@ -85,10 +95,11 @@ class MockGitHubData:
             "body": "First stable release",
             "created_at": "2023-01-01T00:00:00Z",
             "published_at": "2023-01-01T00:00:00Z"
-        }
-    ] * 10  # 10 releases
+        },
+        count=10,  # 10 releases
+    )
     
-    ICEBERG_PYTHON_ISSUES = [
+    ICEBERG_PYTHON_ISSUES = RepeatedItems(
         {
             "id": 3,
             "number": 200,
@@ -97,10 +108,11 @@ class MockGitHubData:
             "body": "Add support for new feature",
             "created_at": "2023-01-01T00:00:00Z",
             "updated_at": "2023-01-01T00:00:00Z"
-        }
-    ] * 151  # 151 open issues
+        },
+        count=151,  # 151 open issues
+    )
     
-    ICEBERG_PYTHON_CLOSED_ISSUES = [
+    ICEBERG_PYTHON_CLOSED_ISSUES = RepeatedItems(
         {
             "id": 4,
             "number": 201,
@@ -110,8 +122,9 @@ class MockGitHubData:
             "created_at": "2023-01-01T00:00:00Z",
             "closed_at": "2023-03-15T00:00:00Z",
             "updated_at": "2023-03-15T00:00:00Z"
-        }
-    ] * 431  # 431 closed issues
+        },
+        count=431,  # 431 closed issues
+    )
     
     HUDI_RS_REPO = {
         "id": 456789123,
@@ -127,7 +140,7 @@ class MockGitHubData:
         "html_url": "https://github.com/apache/hudi-rs"
     }
     
-    HUDI_RS_RELEASES = [
+    HUDI_RS_RELEASES = RepeatedItems(
         {
             "id": 5,
             "tag_name": "v0.1.0",
@@ -135,10 +148,11 @@ class MockGitHubData:
             "body": "Initial release",
             "created_at": "2023-01-01T00:00:00Z",
             "published_at": "2023-01-01T00:00:00Z"
-        }
-    ] * 3  # 3 releases
+        },
+        count=3,  # 3 releases
+    )
     
-    HUDI_RS_ISSUES = [
+    HUDI_RS_ISSUES = RepeatedItems(
         {
             "id": 6,
             "number": 300,
@@ -147,10 +161,11 @@ class MockGitHubData:
             "body": "Propose new enhancement",
             "created_at": "2023-01-01T00:00:00Z",
             "updated_at": "2023-01-01T00:00:00Z"
-        }
-    ] * 28  # 28 open issues
+        },
+        count=28,  # 28 open issues
+    )
     
-    HUDI_RS_CLOSED_ISSUES = [
+    HUDI_RS_CLOSED_ISSUES = RepeatedItems(
         {
             "id": 7,
             "number": 301,
@@ -160,12 +175,13 @@ class MockGitHubData:
             "created_at": "2023-01-01T00:00:00Z",
             "closed_at": "2023-02-15T00:00:00Z",
             "updated_at": "2023-02-15T00:00:00Z"
-        }
-    ] * 62  # 62 closed issues
+        },
+        count=62,  # 62 closed issues
+    )
     
     # Pull request data for each repository
     DELTA_RS_PRS = {
-        "open": [
+        "open": RepeatedItems(
             {
                 "id": 8,
                 "number": 400,
@@ -174,9 +190,10 @@ class MockGitHubData:
                 "body": "Implementing new feature",
                 "created_at": "2023-01-01T00:00:00Z",
                 "updated_at": "2023-01-01T00:00:00Z"
-            }
-        ] * 17,  # 17 open PRs
-        "closed": [
+            },
+            count=17,  # 17 open PRs
+        ),
+        "closed": RepeatedItems(
             {
                 "id": 9,
                 "number": 401,
@@ -186,12 +203,13 @@ class MockGitHubData:
                 "created_at": "2023-01-01T00:00:00Z",
                 "closed_at": "2023-01-10T00:00:00Z",
                 "updated_at": "2023-01-10T00:00:00Z"
-            }
-        ] * 1973  # 1973 closed PRs
+            },
+            count=1973,  # 1973 closed PRs
+        )
     }
     
     ICEBERG_PYTHON_PRS = {
-        "open": [
+        "open": RepeatedItems(
             {
                 "id": 10,
                 "number": 500,
@@ -200,9 +218,10 @@ class MockGitHubData:
                 "body": "Adding new feature",
                 "created_at": "2023-01-01T00:00:00Z",
                 "updated_at": "2023-01-01T00:00:00Z"
-            }
-        ] * 76,  # 76 open PRs
-        "closed": [
+            },
+            count=76,  # 76 open PRs
+        ),
+        "closed": RepeatedItems(
             {
                 "id": 11,
                 "number": 501,
@@ -212,12 +231,13 @@ class MockGitHubData:
                 "created_at": "2023-01-01T00:00:00Z",
                 "closed_at": "2023-01-09T00:00:00Z",
                 "updated_at": "2023-01-09T00:00:00Z"
-            }
-        ] * 1292  # 1292 closed PRs
+            },
+            count=1292,  # 1292 closed PRs
+        )
     }
     
     HUDI_RS_PRS = {
-        "open": [
+        "open": RepeatedItems(
             {
                 "id": 12,
                 "number": 600,
@@ -226,9 +246,10 @@ class MockGitHubData:
                 "body": "Adding enhancement",
                 "created_at": "2023-01-01T00:00:00Z",
                 "updated_at": "2023-01-01T00:00:00Z"
-            }
-        ] * 13,  # 13 open PRs
-        "closed": [
+            },
+            count=13,  # 13 open PRs
+        ),
+        "closed": RepeatedItems(
             {
                 "id": 13,
                 "number": 601,
@@ -238,8 +259,9 @@ class MockGitHubData:
                 "created_at": "2023-01-01T00:00:00Z",
                 "closed_at": "2023-01-09T00:00:00Z",
                 "updated_at": "2023-01-09T00:00:00Z"
-            }
-        ] * 222  # 222 closed PRs
+            },
+            count=222,  # 222 closed PRs
+        )
     }
 
 class MockGitHubAPI:
@@ -263,9 +285,18 @@ class MockGitHubAPI:
                 "apache/hudi-rs": MockGitHubData.HUDI_RS_RELEASES
             },
             "issues": {
-                "delta-io/delta-rs": MockGitHubData.DELTA_RS_ISSUES + MockGitHubData.DELTA_RS_CLOSED_ISSUES,
-                "apache/iceberg-python": MockGitHubData.ICEBERG_PYTHON_ISSUES + MockGitHubData.ICEBERG_PYTHON_CLOSED_ISSUES,
-                "apache/hudi-rs": MockGitHubData.HUDI_RS_ISSUES + MockGitHubData.HUDI_RS_CLOSED_ISSUES
+                "delta-io/delta-rs": {
+                    "open": MockGitHubData.DELTA_RS_ISSUES,
+                    "closed": MockGitHubData.DELTA_RS_CLOSED_ISSUES
+                },
+                "apache/iceberg-python": {
+                    "open": MockGitHubData.ICEBERG_PYTHON_ISSUES,
+                    "closed": MockGitHubData.ICEBERG_PYTHON_CLOSED_ISSUES
+                },
+                "apache/hudi-rs": {
+                    "open": MockGitHubData.HUDI_RS_ISSUES,
+                    "closed": MockGitHubData.HUDI_RS_CLOSED_ISSUES
+                }
             },
             "pull_requests": {
                 "delta-io/delta-rs": MockGitHubData.DELTA_RS_PRS,
@@ -281,7 +312,8 @@ class MockGitHubAPI:
             owner (str): Repository owner
             repo (str): Repository name
             data_type (str): Type of data ('repositories', 'releases', 'issues', or 'pull_requests')
-            data (Any): Mock data to set
+            data (Any): Mock data to set. Issues and pull requests are set as a dictionary
+                with the lists of 'open' and 'closed' items.
         """
         repo_full_name = f"{owner}/{repo}"
         if data_type not in self._data:
@@ -299,29 +331,32 @@ class MockGitHubAPI:
             "full_name": repo_full_name
         })
     
-    def get_releases(self, owner: str, repo: str) -> List[Dict[str, Any]]:
+    def get_releases(self, owner: str, repo: str) -> Sequence[Dict[str, Any]]:
         """Get mock repository releases."""
         repo_full_name = f"{owner}/{repo}"
         logger.debug(f"Mock: Getting releases for {repo_full_name}")
         return self._data["releases"].get(repo_full_name, MockGitHubData.DELTA_RS_RELEASES)
     
-    def get_issues(self, owner: str, repo: str, state: str = 'all') -> List[Dict[str, Any]]:
+    def get_issues(self, owner: str, repo: str, state: str = 'all') -> Sequence[Dict[str, Any]]:
         """Get mock repository issues."""
         repo_full_name = f"{owner}/{repo}"
         logger.debug(f"Mock: Getting issues for {repo_full_name}")
-        all_issues = self._data["issues"].get(repo_full_name, 
-            MockGitHubData.DELTA_RS_ISSUES + MockGitHubData.DELTA_RS_CLOSED_ISSUES)
+        issues_data = self._data["issues"].get(repo_full_name, {
+            "open": MockGitHubData.DELTA_RS_ISSUES,
+            "closed": MockGitHubData.DELTA_RS_CLOSED_ISSUES
+        })
         
-        if state != 'all':
-            return [issue for issue in all_issues if issue['state'] == state]
-        return all_issues
+        # Issues are stored by state, so no filtering is needed
+        if state == 'all':
+            return ChainedItems(issues_data['open'], issues_data['closed'])
+        return issues_data.get(state, [])
     
-    def get_pull_requests(self, owner: str, repo: str, state: str = 'all') -> List[Dict[str, Any]]:
+    def get_pull_requests(self, owner: str, repo: str, state: str = 'all') -> Sequence[Dict[str, Any]]:
         """Get mock repository pull requests."""
         repo_full_name = f"{owner}/{repo}"
         logger.debug(f"Mock: Getting pull requests for {repo_full_name}")
         prs_data = self._data["pull_requests"].get(repo_full_name, MockGitHubData.DELTA_RS_PRS)
         
         if state == 'all':
-            return prs_data['open'] + prs_data['closed']
-        return prs_data.get(state, []) 
+            return ChainedItems(prs_data['open'], prs_data['closed'])
+        return prs_data.get(state, [])
@@ -1,12 +1,21 @@
-from typing import Any, Generator
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Generator, Iterable
 from urllib.parse import urljoin, urlparse, parse_qs
-import datetime
+import hashlib
+import itertools
+import json
+import tempfile
+import threading
 import time 
 import os
 import logging
+import random
 
+import orjson
 import requests
-from dagster import ConfigurableResource, get_dagster_logger
+from dagster import ConfigurableResource, InitResourceContext, get_dagster_logger
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
@@ -20,21 +29,211 @@ except ImportError:
         logger.warning(f"Could not import MockGitHubAPI: {e}")
         MockGitHubAPI = None
 
+# Pause until the rate limit resets, when fewer requests than this are left
+RATE_LIMIT_MIN_REMAINING = 5
+
+# Wait time in seconds for a secondary rate limit, if GitHub does not send a `Retry-After` header
+SECONDARY_RATE_LIMIT_DEFAULT_WAIT = 60
+
+# Up to this fraction of a retry delay is added at random, so concurrent workers don't retry at the same moment
+RETRY_JITTER = 0.3
+
+# Fields of a repository, which are requested from the GitHub GraphQL API
+GRAPHQL_REPOSITORY_FIELDS = (
+    'databaseId name nameWithOwner description url stargazerCount forkCount watchers { totalCount } createdAt updatedAt'
+)
+
+# Filters of the connections of closed issues and pull requests, which are requested from the GitHub GraphQL API.
+# Only their timestamps are needed for the report, releases and open items are just counted.
+GRAPHQL_CLOSED_CONNECTIONS = {
+    'issues': 'states: CLOSED',
+    'pullRequests': 'states: [CLOSED, MERGED]',
+}
+
+class ResponseCache:
+    """Disk cache for responses of the GitHub REST API, which get revalidated with conditional requests.
+
+    A cached response is requested again with its `ETag` (`If-None-Match`) and `Last-Modified` (`If-Modified-Since`).
+    If the resource did not change, GitHub answers with `304 Not Modified` and an empty body, which does not count
+    against the rate limit, and the cached body is used instead.
+
+    Each response is stored as a JSON file, which is named after the hash of the scope, method, URL and query
+    parameters. Responses are only served to requests of the same scope, e.g. made with the same GitHub tokens,
+    so data which is only visible to one token is never handed to requests made with another one.
+    Entries are overwritten when a response changes, but never evicted.
+
+    Args:
+        - directory (str):
+            Directory for the cached responses. It is created with the first stored response, if it does not exist.
+        - scope (str, optional):
+            Identifier of the credentials of the requests, e.g. a hash of the GitHub tokens. Defaults to ''.
+    """
+
+    def __init__(self, directory: str, scope: str = ''):
+        """Initialize the cache without touching the file system, see `set`."""
+        self.directory = directory
+        self.scope = scope
+
+    def _get_file_path(self, method: str, url: str, params: dict) -> str:
+        """Get the path of the cache file for a request."""
+        key = json.dumps([self.scope, method.upper(), url, sorted((str(k), str(v)) for k, v in params.items())])
+        return os.path.join(self.directory, f'{hashlib.sha256(key.encode("utf-8")).hexdigest()}.json')
+
+    def get(self, method: str, url: str, params: dict) -> dict[str, Any] | None:
+        """Get the cached response for a request, or `None` if it was not cached yet."""
+        try:
+            with open(self._get_file_path(method, url, params), 'rb') as fp:
+                return orjson.loads(fp.read())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            return None
+
+    def set(self, method: str, url: str, params: dict, response: requests.Response) -> None:
+        """Store a successful response, if GitHub sent validators (`ETag` or `Last-Modified`) for it."""
+        if 'ETag' not in response.headers and 'Last-Modified' not in response.headers:
+            return
+
+        entry = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'link': response.headers.get('Link'),
+            'body': response.content.decode('utf-8'),
+        }
+        # The directory is only created once there is something to store, not when the resource is configured
+        os.makedirs(self.directory, exist_ok=True)
+        # Write to a temporary file first, so concurrent readers never see a partially written file
+        with tempfile.NamedTemporaryFile('wb', dir=self.directory, delete=False) as fp:
+            fp.write(orjson.dumps(entry))
+        os.replace(fp.name, self._get_file_path(method, url, params))
+
+    @staticmethod
+    def get_conditional_headers(entry: dict[str, Any]) -> dict[str, str]:
+        """Get the headers for revalidating a cached response."""
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    @staticmethod
+    def to_response(entry: dict[str, Any], not_modified_response: requests.Response) -> requests.Response:
+        """Build a response from a cached entry, after GitHub answered with `304 Not Modified`.
+
+        The headers of the `304` response are kept (e.g. the current rate limit), only the pagination links
+        are restored from the cache, so the response can be used in the same way as the original one.
+        """
+        response = requests.Response()
+        response.status_code = 200
+        response.url = not_modified_response.url
+        response.request = not_modified_response.request
+        response.headers.update(not_modified_response.headers)
+        if entry.get('link'):
+            response.headers['Link'] = entry['link']
+        response.encoding = 'utf-8'
+        response._content = entry['body'].encode('utf-8')
+        return response
+
+
+class RateLimitBucket:
+    """Client-side token bucket for a rate limit of the GitHub API, shared by all threads of the resource.
+
+    GitHub grants a fixed number of requests per time window (`X-RateLimit-Limit`) and reports with every
+    response how many requests are left (`X-RateLimit-Remaining`) and when the window ends (`X-RateLimit-Reset`).
+    The bucket is calibrated with these headers. Every request takes a token before it is sent, so concurrent
+    threads don't send requests which GitHub would reject, but wait until the window resets instead.
+    Until the first response arrived, the limit is unknown and requests are not throttled.
+
+    Args:
+        - reserve (int, optional):
+            Number of requests, which are left unused in every window. Defaults to `RATE_LIMIT_MIN_REMAINING`.
+    """
+
+    def __init__(self, reserve: int = RATE_LIMIT_MIN_REMAINING):
+        """Initialize the bucket with an unknown limit, see `update`."""
+        self._condition = threading.Condition()
+        self._reserve = reserve
+        self._limit: int | None = None
+        self._tokens = 0
+        self._reset_time = 0
+        # Reset time of the window, for which the pause was logged already
+        self._logged_reset_time = 0
+
+    def acquire(self) -> None:
+        """Take a token for a request, waiting for the reset of the rate limit if no token is left."""
+        with self._condition:
+            while self._limit is not None and self._tokens <= 0:
+                sleep_duration = self._reset_time - time.time()
+                if sleep_duration <= 0:
+                    # A new window started, the next response calibrates the bucket again
+                    self._tokens = self._limit - self._reserve
+                    break
+                # All waiting threads pause for the same window, so it is only logged once
+                if self._logged_reset_time != self._reset_time:
+                    self._logged_reset_time = self._reset_time
+                    get_dagster_logger().warning(
+                        f"GitHub API rate limit is used up. Pausing for {sleep_duration:.2f} seconds until it resets."
+                    )
+                self._condition.wait(timeout=sleep_duration)
+            self._tokens -= 1
+
+    def has_tokens(self) -> bool:
+        """Check if a request can be sent without waiting for the reset of the rate limit."""
+        with self._condition:
+            return self._limit is None or self._tokens > 0 or self._reset_time <= time.time()
+
+    def update(self, response: requests.Response) -> None:
+        """Calibrate the bucket with the `X-RateLimit-*` headers of a response.
+
+        Args:
+            - response (requests.Response):
+                Response of the GitHub API. Responses without rate limit headers are ignored.
+        """
+        headers = response.headers
+        if not all(f'X-RateLimit-{name}' in headers for name in ('Limit', 'Remaining', 'Reset')):
+            return
+
+        tokens = int(headers['X-RateLimit-Remaining']) - self._reserve
+        reset_time = int(headers['X-RateLimit-Reset'])
+        with self._condition:
+            self._limit = int(headers['X-RateLimit-Limit'])
+            if reset_time > self._reset_time:
+                # First response of a new window
+                self._tokens = tokens
+                self._reset_time = reset_time
+            elif reset_time == self._reset_time:
+                # Responses of concurrent requests arrive in any order, so keep the lowest number of requests left.
+                # Tokens of requests which were sent but not answered yet are already taken.
+                self._tokens = min(self._tokens, tokens)
+            self._condition.notify_all()
+
+
 class GitHubAPIResource(ConfigurableResource):
     """Custom Dagster resource for the GitHub REST API.
 
     Args:
         - github_token (str | None, optional):
             GitHub token for authentication. If no token is set, the API calls will be without authentication.
+        - github_tokens (list[str], optional):
+            Several GitHub tokens, which are used in turns (round-robin) instead of `github_token`.
+            Each token has its own rate limit. All tokens must have the same scope (access to the same repositories),
+            because any of them can send a request.
         - host (str, optional):
             Host address of the GitHub REST API. Defaults to 'https://api.github.com'.
         - retry_attempts (int): Number of times to retry failed requests. Defaults to 3.
         - retry_delay_seconds (int): Initial delay in seconds before retrying. Defaults to 5.
+        - pagination_workers (int): Number of pages of a list endpoint requested concurrently. Defaults to 4.
+        - use_graphql (bool): Fetch repository data with the GraphQL API instead of the REST API. Defaults to False.
+        - response_cache_dir (str | None, optional):
+            Directory for caching responses, which get revalidated with conditional requests.
+            If no directory is set, responses are not cached. Cached responses are only reused with the same tokens.
     """
 
     github_token: str | None = None
     """GitHub token for authentication. If no token is set, the API calls will be without authentication."""
 
+    github_tokens: list[str] = []
+    """GitHub tokens, which are used in turns instead of `github_token`. Each token has its own rate limit."""
+
     host: str = 'https://api.github.com'
     """Host of the GitHub REST API."""
 
@@ -44,9 +243,35 @@ class GitHubAPIResource(ConfigurableResource):
     retry_delay_seconds: int = 5
     """Initial delay in seconds before retrying (exponential backoff)."""
 
+    pagination_workers: int = 4
+    """Number of pages of a list endpoint requested concurrently."""
+
+    use_graphql: bool = False
+    """Fetch repository data with the GraphQL API instead of the REST API. Requires a `github_token`."""
+
+    response_cache_dir: str | None = None
+    """Directory for caching responses, which get revalidated with conditional requests (`ETag`)."""
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         logger = get_dagster_logger()
+
+        # HTTP session is created on first use, see `_get_session`
+        self._session = None
+        self._session_lock = threading.Lock()
+
+        # Tokens are used round-robin with client-side rate limiting per token and rate limit of the API
+        # ('core' or 'graphql'), see `_acquire_token`
+        self._github_tokens = self.github_tokens or [self.github_token]
+        self._token_cycle = itertools.cycle(self._github_tokens)
+        self._token_lock = threading.Lock()
+
+        # Cached responses are scoped to the tokens, so they are never reused with different credentials
+        self._response_cache = None
+        if self.response_cache_dir:
+            token_hash = hashlib.sha256('\n'.join(token or '' for token in self._github_tokens).encode('utf-8'))
+            self._response_cache = ResponseCache(self.response_cache_dir, scope=token_hash.hexdigest())
+        self._rate_limit_buckets: dict[tuple[str | None, str], RateLimitBucket] = {}
         
         # Debug logging for environment variable
         mock_env = os.getenv('GITHUB_USE_MOCK', '')
@@ -63,6 +288,85 @@ class GitHubAPIResource(ConfigurableResource):
         else:
             logger.info("Using real GitHub API (mock mode is disabled)")
 
+    def teardown_after_execution(self, context: InitResourceContext) -> None:
+        """Close the HTTP session and its pooled connections after the run."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def _get_session(self) -> requests.Session:
+        """Get the HTTP session of the resource, creating it on first use.
+
+        All requests share one session, so the TCP and TLS connections to the API are kept alive and reused
+        (connection pooling) and only the first request to the host pays for the handshakes.
+        Headers which are the same for every request are set once on the session. The `Authorization` header
+        is set per request, see `_acquire_token`.
+
+        Returns:
+            - requests.Session:
+                Session for requests to the GitHub REST API.
+        """
+        with self._session_lock:
+            if self._session is None:
+                session = requests.Session()
+                # Retries are handled by `execute_request`, so the adapter itself must not retry.
+                # Several list endpoints are paginated at the same time, each with `pagination_workers` threads
+                # (see `fetch_repo_data`). The pool keeps a connection alive for each of them, otherwise
+                # connections would be discarded after use and the next request pays for a new handshake.
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8 * self.pagination_workers, max_retries=0)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                session.headers.update({
+                    'Accept': 'application/vnd.github+json',
+                    'X-GitHub-Api-Version': '2022-11-28', # Explicitly set API version header
+                })
+                self._session = session
+            return self._session
+
+    def _acquire_token(self, path: str) -> tuple[str | None, RateLimitBucket]:
+        """Select the GitHub token for the next request and take a token of its rate limit bucket.
+
+        The tokens are used in turns. Tokens whose rate limit is used up are skipped, if the rate limits
+        of all tokens are used up, the request waits for the reset of the next one. The REST API ('core')
+        and the GraphQL API ('graphql') have separate rate limits.
+
+        Args:
+            - path (str):
+                Path of the endpoint.
+
+        Returns:
+            - tuple[str | None, RateLimitBucket]:
+                The GitHub token (None without authentication) and the rate limit bucket of the request.
+        """
+        resource = 'graphql' if path == '/graphql' else 'core'
+        with self._token_lock:
+            for _ in range(len(self._github_tokens)):
+                token = next(self._token_cycle)
+                if (token, resource) not in self._rate_limit_buckets:
+                    self._rate_limit_buckets[(token, resource)] = RateLimitBucket()
+                bucket = self._rate_limit_buckets[(token, resource)]
+                if bucket.has_tokens():
+                    break
+
+        bucket.acquire()
+        return token, bucket
+
+    def _has_available_token(self, path: str) -> bool:
+        """Check if any GitHub token can send a request to the endpoint without waiting for a reset.
+
+        Args:
+            - path (str):
+                Path of the endpoint.
+
+        Returns:
+            - bool:
+                True if the rate limit of at least one token is not used up (or not known yet).
+        """
+        resource = 'graphql' if path == '/graphql' else 'core'
+        with self._token_lock:
+            buckets = [self._rate_limit_buckets.get((token, resource)) for token in self._github_tokens]
+        return any(bucket is None or bucket.has_tokens() for bucket in buckets)
+
     def execute_request(
         self,
         method: str,
@@ -103,37 +407,65 @@ class GitHubAPIResource(ConfigurableResource):
         # Passed parameters win over default
         params = {**default_params, **params}
 
-        headers = {
-            'Accept': 'application/vnd.github+json',
-            'X-GitHub-Api-Version': '2022-11-28', # Explicitly set API version header
-        }
-        if self.github_token:
-            headers['Authorization'] = f'Bearer {self.github_token}'
-
+        session = self._get_session()
         url = full_url if full_url else urljoin(self.host, path)
+
+        # Revalidate a cached response instead of downloading it again
+        cache_entry = None
+        headers = {}
+        if self._response_cache is not None and method.upper() == 'GET':
+            cache_entry = self._response_cache.get(method, url, params)
+            if cache_entry is not None:
+                headers = ResponseCache.get_conditional_headers(cache_entry)
+
         retries = 0
         while retries <= self.retry_attempts:
             try:
-                response = requests.request(
+                token, rate_limit_bucket = self._acquire_token(path)
+                response = session.request(
                     method=method,
                     url=url,
                     params=params,
-                    headers=headers,
+                    headers={**headers, 'Authorization': f'Bearer {token}'} if token else headers,
                     json=json,
                     timeout=30, # Added timeout to prevent hanging requests
                 )
                 logger.info(f'Call {method}: {response.url}')
+                rate_limit_bucket.update(response)
+
+                # Resource did not change since it was cached
+                if response.status_code == 304 and cache_entry is not None:
+                    logger.info(f'Not modified, using cached response for {response.url}')
+                    return ResponseCache.to_response(cache_entry, response)
 
                 # Check for rate limit
                 if response.status_code == 403 and 'X-RateLimit-Remaining' in response.headers and int(response.headers['X-RateLimit-Remaining']) == 0:
+                    # Retry at once if another token can send the request, instead of waiting for the reset of this one
+                    if self._has_available_token(path):
+                        logger.warning("GitHub API rate limit of the token exceeded. Retrying with another token.")
+                        retries += 1
+                        continue
                     reset_time = int(response.headers['X-RateLimit-Reset'])
-                    sleep_duration = max(0, reset_time - datetime.datetime.now(datetime.timezone.utc).timestamp()) + 5 # Add a buffer
+                    sleep_duration = max(0, reset_time - time.time()) + 5 # Add a buffer
                     logger.warning(f"GitHub API rate limit exceeded. Retrying in {sleep_duration:.2f} seconds.")
                     time.sleep(sleep_duration)
                     retries += 1
                     continue # Skip raise_for_status and retry
 
+                # Check for secondary rate limit (e.g. too many concurrent requests)
+                if self._is_secondary_rate_limit(response):
+                    sleep_duration = self._get_retry_delay(response, default=SECONDARY_RATE_LIMIT_DEFAULT_WAIT)
+                    logger.warning(
+                        f"Attempt {retries + 1}/{self.retry_attempts + 1}: "
+                        f"GitHub API secondary rate limit exceeded. Retrying in {sleep_duration:.2f} seconds."
+                    )
+                    time.sleep(sleep_duration)
+                    retries += 1
+                    continue # Skip raise_for_status and retry
+
                 response.raise_for_status() # Raise HTTPError for bad responses (4xx or 5xx)
+                if self._response_cache is not None and method.upper() == 'GET':
+                    self._response_cache.set(method, url, params, response)
                 return response
 
             except requests.exceptions.HTTPError as err:
@@ -141,37 +473,89 @@ class GitHubAPIResource(ConfigurableResource):
                     logger.error(f"Client error ({response.status_code}) fetching data: {err!r} - {response.text}")
                     raise # Re-raise immediately for client errors
                 else: # Server error or other retriable HTTP errors
+                    # Wait as long as the server asks for, e.g. with HTTP 503, otherwise back off exponentially
+                    sleep_duration = self._get_retry_delay(response, default=self.retry_delay_seconds * (2 ** retries))
                     logger.warning(
                         f"Attempt {retries + 1}/{self.retry_attempts + 1}: "
                         f"HTTP error ({response.status_code}) for {url}: {err!r}. "
-                        f"Retrying in {self.retry_delay_seconds * (2 ** retries):.2f} seconds."
+                        f"Retrying in {sleep_duration:.2f} seconds."
                     )
             except requests.exceptions.ConnectionError as err:
+                sleep_duration = self._get_retry_delay(None, default=self.retry_delay_seconds * (2 ** retries))
                 logger.warning(
                     f"Attempt {retries + 1}/{self.retry_attempts + 1}: "
                     f"Connection error for {url}: {err!r}. "
-                    f"Retrying in {self.retry_delay_seconds * (2 ** retries):.2f} seconds."
+                    f"Retrying in {sleep_duration:.2f} seconds."
                 )
             except requests.exceptions.Timeout as err:
+                sleep_duration = self._get_retry_delay(None, default=self.retry_delay_seconds * (2 ** retries))
                 logger.warning(
                     f"Attempt {retries + 1}/{self.retry_attempts + 1}: "
                     f"Timeout error for {url}: {err!r}. "
-                    f"Retrying in {self.retry_delay_seconds * (2 ** retries):.2f} seconds."
+                    f"Retrying in {sleep_duration:.2f} seconds."
                 )
             except Exception as err:
                 logger.error(f"An unexpected error occurred during request to {url}: {err!r}")
                 raise
 
-            # Exponential backoff
-            time.sleep(self.retry_delay_seconds * (2 ** retries))
+            time.sleep(sleep_duration)
             retries += 1
 
         logger.error(f"Failed to execute request to {url} after {self.retry_attempts} retries.")
         raise requests.exceptions.RequestException(f"Max retries exceeded for {url}")
 
+    @staticmethod
+    def _get_retry_delay(response: requests.Response | None, default: float) -> float:
+        """Get the seconds to wait before a request is retried.
+
+        The `Retry-After` header of the response is honored, if GitHub sent one. Only a number of seconds is
+        understood, an HTTP-date value falls back to the default like a missing header. The default is e.g.
+        an exponential backoff. A random jitter of up to `RETRY_JITTER` of the delay is added on top.
+
+        Args:
+            - response (requests.Response | None):
+                Response, which failed. None for connection errors and timeouts.
+            - default (float):
+                Seconds to wait without a `Retry-After` header.
+
+        Returns:
+            - float:
+                Seconds to wait, including the jitter.
+        """
+        retry_after = response.headers.get('Retry-After', '') if response is not None else ''
+        delay = float(retry_after) if retry_after.isdigit() else default
+        return delay + random.uniform(0, RETRY_JITTER * delay)
+
+    @staticmethod
+    def _is_secondary_rate_limit(response: requests.Response) -> bool:
+        """Check if a response was rejected because of a secondary rate limit.
 
-    def _paginate_request(self, path: str, params: dict | None = None) -> Generator[dict[str, Any], None, None]:
-        """Helper to handle pagination for GitHub API requests."""
+        GitHub answers with HTTP 429, or with HTTP 403 and a `Retry-After` header or a message mentioning
+        the rate limit. Requests rejected by the primary rate limit are handled separately in `execute_request`.
+        """
+        if response.status_code == 429:
+            return True
+        return response.status_code == 403 and (
+            'Retry-After' in response.headers or 'rate limit' in response.text.lower()
+        )
+
+    def _paginate_request(
+        self,
+        path: str,
+        params: dict | None = None,
+        fields: tuple[str, ...] | None = None,
+        filter_fn: Callable[[dict[str, Any]], bool] | None = None,
+    ) -> Generator[dict[str, Any], None, None]:
+        """Helper to handle pagination for GitHub API requests.
+
+        The first page is requested on its own. If its `Link` header points to the last page, all remaining
+        pages are known and get requested concurrently (see `_get_pages`). Otherwise the `next` links are
+        followed one after another.
+
+        The REST API can't select fields, so with `fields` all other fields are dropped as soon as a page is parsed.
+        Pages which are fetched ahead then only hold the selected fields in memory. Likewise, items for which
+        `filter_fn` returns False are dropped right away, before their fields are selected.
+        """
         logger = get_dagster_logger()
         current_params = params.copy() if params else {}
         current_params['per_page'] = 100 # Ensure we get max per page for efficiency
@@ -184,26 +568,87 @@ class GitHubAPIResource(ConfigurableResource):
                 params=current_params,
                 full_url=next_url # Use full_url if paginating
             )
-            data = response.json()
+            data = _select_fields(orjson.loads(response.content), fields, filter_fn=filter_fn)
             yield from data # Yield each item from the current page
 
-            # Check for Link header for pagination
-            if 'Link' in response.headers:
-                links = response.headers['Link'].split(', ')
-                next_link = None
-                for link in links:
-                    if 'rel="next"' in link:
-                        next_link = link.split(';')[0].strip('<>')
-                        break
-                
-                if next_link:
-                    # Reset params for the next page as the full_url contains them
-                    current_params = {} 
-                    next_url = next_link
-                else:
-                    break # No more pages
-            else:
-                break # No Link header, single page result
+            # Fan out the remaining pages, if the first page tells us how many there are
+            if next_url is None and 'last' in response.links:
+                last_query = parse_qs(urlparse(response.links['last']['url']).query)
+                if 'page' in last_query:
+                    last_page = int(last_query['page'][0])
+                    # Don't request more pages at once than the rate limit still allows
+                    workers = self.pagination_workers
+                    if 'X-RateLimit-Remaining' in response.headers:
+                        remaining = int(response.headers['X-RateLimit-Remaining'])
+                        workers = max(1, min(workers, remaining - RATE_LIMIT_MIN_REMAINING))
+                    logger.info(f'Fetching pages 2-{last_page} of {path} with {workers} concurrent requests')
+                    yield from self._get_pages(
+                        path=path,
+                        params=current_params,
+                        pages=range(2, last_page + 1),
+                        workers=workers,
+                        fields=fields,
+                        filter_fn=filter_fn,
+                    )
+                    break
+
+            # Follow the `next` link (parsed from the `Link` header by requests), until there are no more pages
+            next_url = response.links.get('next', {}).get('url')
+            if not next_url:
+                break
+            # Reset params for the next page as the full_url contains them
+            current_params = {}
+
+    def _get_pages(
+        self,
+        path: str,
+        params: dict,
+        pages: range,
+        workers: int,
+        fields: tuple[str, ...] | None = None,
+        filter_fn: Callable[[dict[str, Any]], bool] | None = None,
+    ) -> Generator[dict[str, Any], None, None]:
+        """Request pages of a list endpoint concurrently and yield their items in page order.
+
+        Args:
+            - path (str):
+                Path of the endpoint.
+            - params (dict):
+                Query parameters of the request, without the page number.
+            - pages (range):
+                Page numbers which should be requested.
+            - workers (int):
+                Maximum number of concurrent requests.
+            - fields (tuple[str, ...], optional):
+                Fields of the items to keep, see `_paginate_request`. Defaults to all fields.
+            - filter_fn (Callable[[dict[str, Any]], bool], optional):
+                Only items for which it returns True are kept, see `_paginate_request`. Defaults to all items.
+
+        Returns:
+            - Generator[dict[str, Any], None, None]:
+                Items of all requested pages.
+        """
+        def get_page(page: int) -> list[dict[str, Any]]:
+            response = self.execute_request(method='GET', path=path, params={**params, 'page': page})
+            return _select_fields(orjson.loads(response.content), fields, filter_fn=filter_fn)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Results are yielded in the order of the pages, independent of which request finishes first.
+            # Only a few pages are requested ahead, so callers which consume the items as a stream
+            # don't have to hold all pages in memory at once.
+            futures = deque()
+            try:
+                for page in pages:
+                    futures.append(executor.submit(get_page, page))
+                    if len(futures) >= 2 * workers:
+                        yield from futures.popleft().result()
+                while futures:
+                    yield from futures.popleft().result()
+            except GeneratorExit:
+                # The caller closed the generator before all items were consumed, e.g. because another section
+                # failed. Pages which were requested ahead but not started yet are not needed anymore.
+                executor.shutdown(cancel_futures=True)
+                raise
 
 
     def get_repository(self, owner: str, repo: str) -> dict[str, Any]:
@@ -225,10 +670,35 @@ class GitHubAPIResource(ConfigurableResource):
             
         path = f'/repos/{owner}/{repo}'
         response = self.execute_request(method='GET', path=path)
-        payload = response.json()
+        payload = orjson.loads(response.content)
 
         return payload
 
+    def iter_releases(
+        self, owner: str, repo: str, fields: tuple[str, ...] | None = None
+    ) -> Generator[dict[str, Any], None, None]:
+        """Iterate over the releases of a repository while they are fetched page by page.
+        Docs: https://docs.github.com/en/rest/releases/releases?apiVersion=2022-11-28#list-releases
+
+        Args:
+            - owner (str):
+                The account owner of the repository. The name is not case sensitive.
+            - repo (str):
+                The name of the repository without the `.git` extension. The name is not case sensitive.
+            - fields (tuple[str, ...], optional):
+                Fields of the releases to keep, all others are dropped while fetching. Defaults to all fields.
+
+        Returns:
+            - Generator[dict[str, Any], None, None]:
+                Releases of the repository.
+        """
+        if self._mock_api is not None:
+            yield from _select_fields(self._mock_api.get_releases(owner, repo), fields)
+            return
+
+        path = f'/repos/{owner}/{repo}/releases'
+        yield from self._paginate_request(path=path, fields=fields)
+
     def get_releases(self, owner: str, repo: str) -> list[dict[str, Any]]:
         """Get list of releases for a repository.
         Docs: https://docs.github.com/en/rest/releases/releases?apiVersion=2022-11-28#list-releases
@@ -243,11 +713,41 @@ class GitHubAPIResource(ConfigurableResource):
             - list[dict[str, Any]]:
                 List of releases for the repository.
         """
+        return list(self.iter_releases(owner=owner, repo=repo))
+
+    def iter_issues(
+        self, owner: str, repo: str, state: str = 'all', fields: tuple[str, ...] | None = None
+    ) -> Generator[dict[str, Any], None, None]:
+        """Iterate over the issues (excluding pull requests) of a repository while they are fetched page by page.
+        Docs: https://docs.github.com/en/rest/issues/issues?apiVersion=2022-11-28#list-repository-issues
+
+        Args:
+            - owner (str):
+                The account owner of the repository. The name is not case sensitive.
+            - repo (str):
+                The name of the repository without the `.git` extension. The name is not case sensitive.
+            - state (str, optional):
+                Indicates the state of the issues to return. Can be either 'open', 'closed', or 'all'.
+                Defaults to 'all'.
+            - fields (tuple[str, ...], optional):
+                Fields of the issues to keep, all others are dropped while fetching. Defaults to all fields.
+
+        Returns:
+            - Generator[dict[str, Any], None, None]:
+                Issues (excluding pull requests) of the repository.
+        """
         if self._mock_api is not None:
-            return self._mock_api.get_releases(owner, repo)
-            
-        path = f'/repos/{owner}/{repo}/releases'
-        return list(self._paginate_request(path=path))
+            yield from _select_fields(self._mock_api.get_issues(owner, repo, state), fields)
+            return
+
+        path = f'/repos/{owner}/{repo}/issues'
+        params = {'state': state}
+
+        # Filter out pull requests by checking if 'pull_request' key exists in the response
+        # Pull requests will have this key, regular issues won't
+        yield from self._paginate_request(
+            path=path, params=params, fields=fields, filter_fn=lambda issue: 'pull_request' not in issue
+        )
 
     def get_issues(self, owner: str, repo: str, state: str = 'all') -> list[dict[str, Any]]:
         """Get list of issues (excluding pull requests) in a repository.
@@ -269,18 +769,37 @@ class GitHubAPIResource(ConfigurableResource):
             - list[dict[str, Any]]:
                 List of issues (excluding pull requests) in the repository.
         """
+        return list(self.iter_issues(owner=owner, repo=repo, state=state))
+
+    def iter_pull_requests(
+        self, owner: str, repo: str, state: str = 'all', fields: tuple[str, ...] | None = None
+    ) -> Generator[dict[str, Any], None, None]:
+        """Iterate over the pull requests of a repository while they are fetched page by page.
+        Docs: https://docs.github.com/en/rest/pulls/pulls?apiVersion=2022-11-28#list-pull-requests
+
+        Args:
+            - owner (str):
+                The account owner of the repository. The name is not case sensitive.
+            - repo (str):
+                The name of the repository without the `.git` extension. The name is not case sensitive.
+            - state (str, optional):
+                Indicates the state of the pull requests to return. Can be either 'open', 'closed', or 'all'.
+                Defaults to 'all'.
+            - fields (tuple[str, ...], optional):
+                Fields of the pull requests to keep, all others are dropped while fetching. Defaults to all fields.
+
+        Returns:
+            - Generator[dict[str, Any], None, None]:
+                Pull requests of the repository.
+        """
         if self._mock_api is not None:
-            return self._mock_api.get_issues(owner, repo, state)
-            
-        path = f'/repos/{owner}/{repo}/issues'
-        params = {'state': state}
-        
-        # Filter out pull requests by checking if 'pull_request' key exists in the response
-        # Pull requests will have this key, regular issues won't
-        return [
-            issue for issue in self._paginate_request(path=path, params=params)
-            if 'pull_request' not in issue
-        ]
+            yield from _select_fields(self._mock_api.get_pull_requests(owner, repo, state), fields)
+            return
+
+        path = f'/repos/{owner}/{repo}/pulls'
+        # The /pulls endpoint supports the 'all' state as well, so all pages of open and closed pull requests
+        # are known from the first response and can be requested concurrently
+        yield from self._paginate_request(path=path, params={'state': state}, fields=fields)
 
     def get_pull_requests(self, owner: str, repo: str, state: str = 'all') -> list[dict[str, Any]]:
         """Get list of pull requests in a repository.
@@ -302,16 +821,136 @@ class GitHubAPIResource(ConfigurableResource):
             - list[dict[str, Any]]:
                 List of pull requests in the repository.
         """
+        return list(self.iter_pull_requests(owner=owner, repo=repo, state=state))
+
+    def execute_graphql_query(self, query: str, variables: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Execute a query against the GitHub GraphQL API.
+        Docs: https://docs.github.com/en/graphql/guides/forming-calls-with-graphql
+
+        Args:
+            - query (str):
+                GraphQL query.
+            - variables (dict[str, Any], optional):
+                Values for the variables of the query.
+
+        Returns:
+            - dict[str, Any]:
+                The `data` object of the response.
+
+        Raises:
+            - requests.HTTPError:
+                When HTTP 4xx or 5xx response is received after all retries.
+            - requests.RequestException:
+                When the response contains errors, e.g. because the repository does not exist.
+        """
+        response = self.execute_request(
+            method='POST',
+            path='/graphql',
+            json={'query': query, 'variables': variables or {}},
+        )
+        payload = orjson.loads(response.content)
+        if payload.get('errors'):
+            raise requests.exceptions.RequestException(f"GraphQL query failed: {payload['errors']}")
+
+        return payload['data']
+
+    def _paginate_graphql_connection(
+        self, owner: str, repo: str, name: str, connection: dict[str, Any]
+    ) -> Generator[dict[str, Any], None, None]:
+        """Helper to yield all closed issues or pull requests, starting with an already fetched first page.
+
+        The nodes are converted to the field names of the REST API.
+        """
+        query = (
+            'query($owner: String!, $repo: String!, $cursor: String!) { repository(owner: $owner, name: $repo) { '
+            f'{name}({GRAPHQL_CLOSED_CONNECTIONS[name]}, first: 100, after: $cursor) '
+            '{ pageInfo { hasNextPage endCursor } nodes { createdAt closedAt } } } }'
+        )
+
+        while True:
+            for node in connection['nodes']:
+                yield {'state': 'closed', 'created_at': node['createdAt'], 'closed_at': node['closedAt']}
+            if not connection['pageInfo']['hasNextPage']:
+                break
+            variables = {'owner': owner, 'repo': repo, 'cursor': connection['pageInfo']['endCursor']}
+            connection = self.execute_graphql_query(query, variables)['repository'][name]
+
+    def get_repository_summary_graphql(self, owner: str, repo: str) -> dict[str, Any]:
+        """Get metadata and the numbers of releases, issues and pull requests of a repository with the GraphQL API.
+        Docs: https://docs.github.com/en/graphql/reference/objects#repository
+
+        The metadata, the number of releases and open items, and the first 100 closed issues and pull requests
+        are requested in a single query. Releases and open items are only counted (`totalCount`), so only the
+        closed items are paginated afterwards, and only for the timestamps needed for the report.
+        The metadata fields are renamed to the names of the REST API, see `get_repository`.
+
+        Note: The GraphQL API can only be used with a `github_token`.
+
+        Args:
+            - owner (str):
+                The account owner of the repository. The name is not case sensitive.
+            - repo (str):
+                The name of the repository without the `.git` extension. The name is not case sensitive.
+
+        Returns:
+            - dict[str, Any]:
+                Dictionary with the repository 'metadata', the number of 'releases', 'open_issues' and 'open_prs',
+                and the lists of 'closed_issues' and 'closed_prs' with their 'state', 'created_at' and 'closed_at'.
+        """
         if self._mock_api is not None:
-            return self._mock_api.get_pull_requests(owner, repo, state)
-            
-        path = f'/repos/{owner}/{repo}/pulls'
-        
-        # The /pulls endpoint doesn't support 'all' state, we need to make separate calls
-        if state == 'all':
-            open_prs = list(self._paginate_request(path=path, params={'state': 'open'}))
-            closed_prs = list(self._paginate_request(path=path, params={'state': 'closed'}))
-            return open_prs + closed_prs
-        else:
-            return list(self._paginate_request(path=path, params={'state': state}))
+            return {
+                'metadata': self._mock_api.get_repository(owner, repo),
+                'releases': len(self._mock_api.get_releases(owner, repo)),
+                'open_issues': len(self._mock_api.get_issues(owner, repo, 'open')),
+                'closed_issues': self._mock_api.get_issues(owner, repo, 'closed'),
+                'open_prs': len(self._mock_api.get_pull_requests(owner, repo, 'open')),
+                'closed_prs': self._mock_api.get_pull_requests(owner, repo, 'closed'),
+            }
+
+        connections = ' '.join(
+            f'{name}({filters}, first: 100) {{ pageInfo {{ hasNextPage endCursor }} nodes {{ createdAt closedAt }} }}'
+            for name, filters in GRAPHQL_CLOSED_CONNECTIONS.items()
+        )
+        query = (
+            'query($owner: String!, $repo: String!) { repository(owner: $owner, name: $repo) { '
+            f'{GRAPHQL_REPOSITORY_FIELDS} releases {{ totalCount }} openIssues: issues(states: OPEN) {{ totalCount }} '
+            f'openPullRequests: pullRequests(states: OPEN) {{ totalCount }} {connections} }} }}'
+        )
+        repository = self.execute_graphql_query(query, {'owner': owner, 'repo': repo})['repository']
+
+        return {
+            'metadata': {
+                'id': repository['databaseId'],
+                'name': repository['name'],
+                'full_name': repository['nameWithOwner'],
+                'description': repository['description'],
+                'html_url': repository['url'],
+                'stargazers_count': repository['stargazerCount'],
+                'forks_count': repository['forkCount'],
+                'subscribers_count': repository['watchers']['totalCount'],
+                'created_at': repository['createdAt'],
+                'updated_at': repository['updatedAt'],
+            },
+            'releases': repository['releases']['totalCount'],
+            'open_issues': repository['openIssues']['totalCount'],
+            'closed_issues': list(self._paginate_graphql_connection(owner, repo, 'issues', repository['issues'])),
+            'open_prs': repository['openPullRequests']['totalCount'],
+            'closed_prs': list(
+                self._paginate_graphql_connection(owner, repo, 'pullRequests', repository['pullRequests'])
+            ),
+        }
 
+
+def _select_fields(
+    items: Iterable[dict[str, Any]],
+    fields: tuple[str, ...] | None,
+    filter_fn: Callable[[dict[str, Any]], bool] | None = None,
+) -> Iterable[dict[str, Any]]:
+    """Keep only the given fields of the items (all fields if `fields` is None). Missing fields stay missing.
+    With `filter_fn`, only the items for which it returns True are kept.
+    """
+    if filter_fn is not None:
+        items = [item for item in items if filter_fn(item)]
+    if fields is None:
+        return items
+    return [{field: item[field] for field in fields if field in item} for item in items]
@@ -1,5 +1,5 @@
 import requests
-from datetime import datetime
+import pandas as pd
 import time
 
 # Configuration 
@@ -8,14 +8,22 @@ REPO = "delta-io/delta-rs"
 HEADERS = {"Authorization": f"token {GITHUB_TOKEN}"}
 
 
+def wait_for_rate_limit(res):
+    """Sleep until GitHub resets the rate limit, if the response used up the last request."""
+    if int(res.headers.get("X-RateLimit-Remaining", 1)) > 0:
+        return
+    reset_time = int(res.headers.get("X-RateLimit-Reset", time.time()))
+    time.sleep(max(0, reset_time - time.time()))
+
+
 def get_avg_close_time(url, is_issue=True):
     params = {
         "state": "closed",
         "per_page": 100,
         "page": 1
     }
-    total_seconds = 0
-    count = 0
+    created = []
+    closed = []
 
     while True:
         res = requests.get(url, headers=HEADERS, params=params)
@@ -31,15 +39,22 @@ def get_avg_close_time(url, is_issue=True):
                 continue
             if not item.get("closed_at"):
                 continue
-            created = datetime.strptime(item["created_at"], "%Y-%m-%dT%H:%M:%SZ")
-            closed = datetime.strptime(item["closed_at"], "%Y-%m-%dT%H:%M:%SZ")
-            total_seconds += (closed - created).total_seconds()
-            count += 1
+            created.append(item["created_at"])
+            closed.append(item["closed_at"])
 
         params["page"] += 1
-        time.sleep(0.2)
+        wait_for_rate_limit(res)
+
+    count = len(created)
+    if count == 0:
+        return 0, 0
+
+    # Parse all timestamps at once instead of item by item
+    created_at = pd.to_datetime(created, utc=True, format="%Y-%m-%dT%H:%M:%SZ")
+    closed_at = pd.to_datetime(closed, utc=True, format="%Y-%m-%dT%H:%M:%SZ")
+    total_seconds = (closed_at - created_at).sum().total_seconds()
 
-    avg_days = (total_seconds / 86400) / count if count > 0 else 0
+    avg_days = (total_seconds / 86400) / count
     return avg_days, count
 
 # === Run Calculation ===
@@ -1,27 +1,151 @@
-from typing import Any
+from typing import Annotated, Any, Generator, Iterable, Literal
 from datetime import datetime, timezone
 
-import pandas as pd
 from dagster import AssetExecutionContext, MetadataValue
+from pydantic import AwareDatetime, Field, TypeAdapter, ValidationError
+from typing_extensions import NotRequired, TypedDict
+
+# Fields of the summary of issues and pull requests, which is stored with the repository data (see `summarize_items`)
+SUMMARY_FIELDS = ('open', 'closed', 'avg_days_until_closed')
+
 
 def validate_repo_data(repo_data: dict[str, Any]):
     """Basic validation for repository data structure.
     Raises ValueError if expected keys or types are missing.
+
+    The items of the sections are validated while they are fetched, see `validate_items`.
+    Issues and pull requests are stored as summaries, see `summarize_items`.
     """
     if not isinstance(repo_data, dict):
         raise ValueError("repo_data must be a dictionary.")
     if 'metadata' not in repo_data or not isinstance(repo_data['metadata'], dict):
         raise ValueError("repo_data must contain a 'metadata' dictionary.")
-    if 'releases' not in repo_data or not isinstance(repo_data['releases'], list):
-        raise ValueError("repo_data must contain a 'releases' list.")
-    if 'issues' not in repo_data or not isinstance(repo_data['issues'], list):
-        raise ValueError("repo_data must contain an 'issues' list.")
-    if 'prs' not in repo_data or not isinstance(repo_data['prs'], list):
-        raise ValueError("repo_data must contain a 'prs' list.")
+    if 'releases' not in repo_data or not isinstance(repo_data['releases'], int):
+        raise ValueError("repo_data must contain the number of 'releases'.")
+    for section in ('issues', 'prs'):
+        if section not in repo_data or not isinstance(repo_data[section], dict):
+            raise ValueError(f"repo_data must contain a '{section}' summary dictionary.")
+        if any(key not in repo_data[section] for key in SUMMARY_FIELDS):
+            raise ValueError(f"repo_data['{section}'] must contain {', '.join(repr(key) for key in SUMMARY_FIELDS)}.")
     if 'html_url' not in repo_data['metadata']:
          raise ValueError("repo_data['metadata'] must contain 'html_url'.")
 
 
+class Release(TypedDict):
+    """Fields of a release, which are checked by `validate_items`."""
+    id: Annotated[int, Field(gt=0, strict=True)]
+    tag_name: Annotated[str, Field(min_length=1)]
+    created_at: AwareDatetime
+
+
+class ReportItem(TypedDict):
+    """Fields of an issue or pull request, which are needed for the report.
+
+    The timestamps must have a timezone (GitHub sends UTC with a 'Z'), so naive and aware timestamps are never
+    subtracted from each other in `summarize_items`.
+    """
+    state: Literal['open', 'closed']
+    created_at: AwareDatetime
+    closed_at: NotRequired[AwareDatetime | None]
+
+
+# Schemas for the items of the repository data sections
+ITEM_SCHEMAS = {
+    'releases': Release,
+    'issues': ReportItem,
+    'prs': ReportItem,
+}
+
+# Compiled validators for the items of the repository data sections. Other fields of the items are ignored.
+ITEM_VALIDATORS = {section: TypeAdapter(schema).validate_python for section, schema in ITEM_SCHEMAS.items()}
+
+# Fields of the items, which are needed for the validation and the report. Other fields can be dropped while fetching.
+ITEM_FIELDS = {section: tuple(schema.__annotations__) for section, schema in ITEM_SCHEMAS.items()}
+
+
+def validate_items(items: Iterable[Any], section: str) -> Generator[dict[str, Any], None, None]:
+    """Validate the items of a repository data section while they are streamed.
+
+    Each item is checked against the pydantic schema of its section (see `ITEM_VALIDATORS`) as soon as it was fetched,
+    so the items don't have to be collected and iterated a second time for the validation. The first invalid item
+    raises an error, which also stops fetching further pages. Malformed data therefore fails after the first bad item.
+
+    Args:
+        - items (Iterable[Any]):
+            Releases, issues or pull requests, e.g. from a generator of the GitHubAPIResource.
+        - section (str):
+            Name of the section the items belong to ('releases', 'issues' or 'prs').
+
+    Returns:
+        - Generator[dict[str, Any], None, None]:
+            The validated items with only the fields of the schema, e.g. timestamps are parsed to datetimes.
+
+    Raises:
+        - ValueError: When an item is not a dictionary, misses a required field or has an invalid value.
+    """
+    validate_item = ITEM_VALIDATORS[section]
+    for index, item in enumerate(items):
+        try:
+            validated_item = validate_item(item)
+        except ValidationError as e:
+            raise ValueError(f"Item {index} of '{section}' is invalid: {e}") from e
+        yield validated_item
+
+
+def count_items(items: Iterable[Any], section: str) -> int:
+    """Validate the items of a section and count them, without keeping them in memory.
+
+    Args:
+        - items (Iterable[Any]):
+            Releases, issues or pull requests.
+        - section (str):
+            Name of the section the items belong to ('releases', 'issues' or 'prs').
+
+    Returns:
+        - int:
+            Number of items.
+    """
+    return sum(1 for _ in validate_items(items, section=section))
+
+
+def summarize_items(items: Iterable[Any], section: str) -> dict[str, Any]:
+    """Validate the issues or pull requests of a repository and reduce them to the numbers of the report.
+
+    The items are aggregated in a single pass while they are streamed: open and closed items are counted,
+    and the seconds until closed are summed up from the timestamps, which were already parsed by the validation.
+    Neither the API objects nor their timestamps are kept after the item was counted. Only the summary is stored
+    with the asset, so the downstream report doesn't need to load every item.
+
+    Args:
+        - items (Iterable[Any]):
+            Issues or pull requests, e.g. from a generator of the GitHubAPIResource.
+        - section (str):
+            Name of the section the items belong to ('issues' or 'prs').
+
+    Returns:
+        - dict[str, Any]:
+            Number of 'open' and 'closed' items and the 'avg_days_until_closed' of the closed items.
+    """
+    open_count = 0
+    closed_count = 0
+    seconds_until_closed = 0.0
+    timed_count = 0
+    for item in validate_items(items, section=section):
+        if item['state'] == 'open':
+            open_count += 1
+        else:
+            closed_count += 1
+            if item.get('closed_at'):
+                seconds_until_closed += (item['closed_at'] - item['created_at']).total_seconds()
+                timed_count += 1
+
+    return {
+        'open': open_count,
+        'closed': closed_count,
+        'avg_days_until_closed': seconds_until_closed / timed_count / (24 * 3600) if timed_count else 0.0,
+    }
+
+
 def create_markdown_report(context: AssetExecutionContext, report_data: dict[str, dict]) -> str:
     """Create a markdown report from the report data.
 
@@ -35,9 +159,27 @@ def create_markdown_report(context: AssetExecutionContext, report_data: dict[str
         - str:
             Markdown formatted report.
     """
-    # Convert dict with report data to markdown table
-    df_report = pd.DataFrame.from_dict(report_data)
-    md_report = df_report.to_markdown()
+    # Convert dict with report data to markdown table with one column per repository and one row per metric.
+    # The few cells are formatted directly, which is much cheaper than building a DataFrame for them.
+    columns = list(report_data)
+    metrics = list(dict.fromkeys(metric for data in report_data.values() for metric in data))
+    rows = [[metric, *(str(report_data[column].get(metric, '')) for column in columns)] for metric in metrics]
+    widths = [max(len(cell) for cell in cells) for cells in zip(['', *columns], *rows)]
+
+    def format_row(cells: list[str]) -> str:
+        # Align the metric names left and the values right
+        return '| ' + ' | '.join(
+            cell.ljust(width) if index == 0 else cell.rjust(width)
+            for index, (cell, width) in enumerate(zip(cells, widths))
+        ) + ' |'
+
+    md_report = '\n'.join([
+        format_row(['', *columns]),
+        '|' + '|'.join(
+            ':' + '-' * (width + 1) if index == 0 else '-' * (width + 1) + ':' for index, width in enumerate(widths)
+        ) + '|',
+        *(format_row(row) for row in rows),
+    ])
 
     context.add_output_metadata(
         metadata={
@@ -48,37 +190,8 @@ def create_markdown_report(context: AssetExecutionContext, report_data: dict[str
     return md_report
 
 
-def calculate_avg_days_until_closed(items: list[dict[str, Any]]) -> float:
-    """Calculate average days until items were closed.
-
-    Args:
-        - items (list[dict[str, Any]]):
-            List of items (issues or PRs) with created_at and closed_at timestamps.
-
-    Returns:
-        - float:
-            Average days until closure.
-    """
-    closed_items = [
-        item for item in items
-        if item.get('state') == 'closed' and item.get('created_at') and item.get('closed_at')
-    ]
-
-    if not closed_items:
-        return 0.0
-
-    total_days = 0
-    for item in closed_items:
-        created_at = datetime.fromisoformat(item['created_at'].replace('Z', '+00:00'))
-        closed_at = datetime.fromisoformat(item['closed_at'].replace('Z', '+00:00'))
-        days_until_closed = (closed_at - created_at).total_seconds() / (24 * 3600)  # Convert to days
-        total_days += days_until_closed
-
-    return total_days / len(closed_items)
-
-
 def extract_metadata(repo_metadata: dict[str, Any]) -> dict[str, Any]:
-    """Extracts list of fields from the repo metadata, issues and PRs and adds them to the report data dict.
+    """Extracts list of fields from the repo metadata and the summaries of issues and PRs for the report data dict.
 
     Args:
         - repo_metadata (dict[str, Any]):
@@ -89,35 +202,22 @@ def extract_metadata(repo_metadata: dict[str, Any]) -> dict[str, Any]:
             Extracted data from one repository as a column for the report.
     """
     metadata = repo_metadata['metadata']
-    releases = repo_metadata['releases']
+    release_count = repo_metadata['releases']
     issues = repo_metadata['issues']
     prs = repo_metadata['prs']
 
-    # Count open and closed issues
-    open_issues = sum(1 for issue in issues if issue.get('state') == 'open')
-    closed_issues = sum(1 for issue in issues if issue.get('state') == 'closed')
-
-    # Count open and closed PRs
-    open_prs = sum(1 for pr in prs if pr.get('state') == 'open')
-    closed_prs = sum(1 for pr in prs if pr.get('state') == 'closed')
-
-    # Calculate average days until closure
-    avg_days_issues = calculate_avg_days_until_closed(issues)
-    avg_days_prs = calculate_avg_days_until_closed(prs)
-
     # set all fields for the report
     extracted_data = {
         'stars': metadata.get('stargazers_count'),
         'forks': metadata.get('forks_count'),
         'watchers': metadata.get('subscribers_count'),
-        'releases': len(releases),
-        'open issues': open_issues,
-        'closed issues': closed_issues,
-        'avg days until issue was closed': round(avg_days_issues, 1),
-        'open PRs': open_prs,
-        'closed PRs': closed_prs,
-        'avg days until PR was closed': round(avg_days_prs, 1),
+        'releases': release_count,
+        'open issues': issues['open'],
+        'closed issues': issues['closed'],
+        'avg days until issue was closed': round(issues['avg_days_until_closed'], 1),
+        'open PRs': prs['open'],
+        'closed PRs': prs['closed'],
+        'avg days until PR was closed': round(prs['avg_days_until_closed'], 1),
     }
 
     return extracted_data
-
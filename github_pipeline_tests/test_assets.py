@@ -0,0 +1,111 @@
+import threading
+import time
+from unittest import mock
+
+import orjson
+import pytest
+import requests
+
+from github_pipeline.assets import fetch_repo_data
+from github_pipeline.resources import GitHubAPIResource
+
+ISSUE = {'state': 'closed', 'created_at': '2023-01-01T00:00:00Z', 'closed_at': '2023-01-03T00:00:00Z'}
+
+
+class StubGitHubAPI:
+    """Stand-in for `GitHubAPIResource`, whose releases may fail and whose issues never end.
+
+    Args:
+        - releases_error (Exception | None):
+            Error, which is raised instead of returning the releases.
+    """
+
+    use_graphql = False
+
+    def __init__(self, releases_error: Exception | None = None):
+        """Store the error of the releases and track the issues."""
+        self.releases_error = releases_error
+        self.failed = threading.Event()
+        self.issues_closed = threading.Event()
+        self.issues_after_error = 0
+
+    def get_repository(self, owner: str, repo: str) -> dict:
+        """Get the metadata of the repository."""
+        return {'html_url': f'https://github.com/{owner}/{repo}'}
+
+    def iter_releases(self, owner: str, repo: str, **kwargs):
+        """Yield one release, or fail after a short delay."""
+        time.sleep(0.05)
+        if self.releases_error is not None:
+            self.failed.set()
+            raise self.releases_error
+        yield {'id': 1, 'tag_name': 'v1.0.0', 'created_at': '2023-01-01T00:00:00Z'}
+
+    def iter_issues(self, owner: str, repo: str, **kwargs):
+        """Yield issues slowly until the generator is closed."""
+        try:
+            while True:
+                time.sleep(0.01)
+                if self.failed.is_set():
+                    self.issues_after_error += 1
+                yield ISSUE
+        finally:
+            self.issues_closed.set()
+
+    def iter_pull_requests(self, owner: str, repo: str, **kwargs):
+        """Yield one pull request."""
+        yield ISSUE
+
+
+def test_fetch_repo_data_fails_fast_and_stops_the_other_sections():
+    """The first error is raised at once, and the endless issues stop being fetched and are closed."""
+    github_api = StubGitHubAPI(releases_error=requests.HTTPError('502 Server Error'))
+
+    start_time = time.time()
+    with pytest.raises(requests.HTTPError):
+        fetch_repo_data(github_api, 'owner', 'repo')
+
+    assert time.time() - start_time < 1
+    assert github_api.issues_closed.is_set()
+    assert github_api.issues_after_error <= 1  # The issue being fetched while the releases failed
+    time.sleep(0.1)
+    assert github_api.issues_after_error <= 1
+
+
+def test_fetch_repo_data_summarizes_all_sections():
+    """Without an error, all sections are summarized."""
+    github_api = StubGitHubAPI()
+    github_api.iter_issues = lambda owner, repo, **kwargs: (
+        issue for issue in [ISSUE, {**ISSUE, 'state': 'open', 'closed_at': None}]
+    )
+
+    repo_data = fetch_repo_data(github_api, 'owner', 'repo')
+
+    assert repo_data['releases'] == 1
+    assert repo_data['issues'] == {'open': 1, 'closed': 1, 'avg_days_until_closed': 2.0}
+    assert repo_data['prs'] == {'open': 0, 'closed': 1, 'avg_days_until_closed': 2.0}
+
+
+def test_closing_the_pages_cancels_prefetched_pages(monkeypatch):
+    """Pages requested ahead but not started yet are dropped once the caller closes the generator."""
+    monkeypatch.setenv('GITHUB_USE_MOCK', 'false')
+    github_api = GitHubAPIResource(github_token='token')
+    requested_pages = []
+
+    def execute_request(self, method, path, params=None, **kwargs):
+        requested_pages.append(params['page'])
+        time.sleep(0.05)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = orjson.dumps([{'page': params['page']}])
+        return response
+
+    with mock.patch.object(GitHubAPIResource, 'execute_request', execute_request):
+        pages = github_api._get_pages(path='/repos/owner/repo/issues', params={}, pages=range(2, 100), workers=2)
+        assert next(pages) == {'page': 2}
+        pages.close()
+        requested_after_close = len(requested_pages)
+        time.sleep(0.2)
+
+    assert len(requested_pages) == requested_after_close
+    assert requested_after_close <= 2 * 2 + 2  # At most the queued pages plus the pages in flight
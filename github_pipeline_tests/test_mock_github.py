@@ -0,0 +1,38 @@
+import orjson
+import pytest
+
+from github_pipeline.mock_items import ChainedItems, RepeatedItems
+from github_pipeline.resources import GitHubAPIResource
+
+
+def test_repeated_items_are_plain_dicts():
+    """Entries are independent plain dicts, so changing one doesn't change the others or the prototype."""
+    items = RepeatedItems({'id': 1, 'state': 'open'}, count=3)
+
+    assert len(items) == 3
+    assert all(type(item) is dict for item in items)
+    items[0]['state'] = 'closed'
+    assert items[1] == {'id': 1, 'state': 'open'}
+    assert list(items[1:]) == [{'id': 1, 'state': 'open'}] * 2
+    with pytest.raises(IndexError):
+        items[3]
+
+
+def test_chained_items_concatenate_without_copy():
+    """The parts are read in order, also by index."""
+    items = ChainedItems(RepeatedItems({'state': 'open'}, count=2), [{'state': 'closed'}])
+
+    assert len(items) == 3
+    assert [item['state'] for item in items] == ['open', 'open', 'closed']
+    assert items[-1] == {'state': 'closed'}
+
+
+def test_mock_resource_returns_json_serializable_items(monkeypatch):
+    """Items of the mock API can be serialized like the ones of the real API."""
+    monkeypatch.setenv('GITHUB_USE_MOCK', 'true')
+    github_api = GitHubAPIResource()
+
+    issues = github_api.get_issues('delta-io', 'delta-rs')
+
+    assert len(issues) == 139 + 1130
+    assert orjson.loads(orjson.dumps(issues)) == issues
@@ -0,0 +1,252 @@
+import threading
+import time
+from unittest import mock
+
+import orjson
+import pytest
+import requests
+
+from github_pipeline import resources
+from github_pipeline.resources import GitHubAPIResource, RateLimitBucket, ResponseCache
+
+
+def make_response(status_code: int = 200, headers: dict | None = None, body: bytes = b'[]') -> requests.Response:
+    """Build a response like the GitHub API would send it."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response._content = body
+    response.url = 'https://api.github.com/repos/owner/repo/issues'
+    return response
+
+
+def rate_limit_headers(limit: int, remaining: int, reset_time: int) -> dict[str, str]:
+    """Get the `X-RateLimit-*` headers of a response."""
+    return {
+        'X-RateLimit-Limit': str(limit),
+        'X-RateLimit-Remaining': str(remaining),
+        'X-RateLimit-Reset': str(reset_time),
+    }
+
+
+@pytest.fixture
+def github_api(monkeypatch, tmp_path) -> GitHubAPIResource:
+    """GitHub resource for the real API (not the mock) with a response cache and without retry delays."""
+    monkeypatch.setenv('GITHUB_USE_MOCK', 'false')
+    return GitHubAPIResource(
+        github_token='token', retry_delay_seconds=0, response_cache_dir=str(tmp_path / 'response_cache')
+    )
+
+
+def test_rate_limit_bucket_is_calibrated_with_headers():
+    """The bucket allows as many requests as GitHub reports, minus the reserve."""
+    bucket = RateLimitBucket(reserve=5)
+    assert bucket.has_tokens()  # Limit is unknown before the first response
+
+    bucket.update(make_response(headers=rate_limit_headers(limit=5000, remaining=7, reset_time=int(time.time()) + 60)))
+    bucket.acquire()
+    bucket.acquire()
+    assert not bucket.has_tokens()
+
+    # A response of an earlier request of the same window doesn't refill the bucket
+    bucket.update(make_response(headers=rate_limit_headers(limit=5000, remaining=7, reset_time=int(time.time()) + 60)))
+    assert not bucket.has_tokens()
+
+
+def test_rate_limit_bucket_waits_for_reset(monkeypatch):
+    """Threads without a token wait until the window resets, and the pause is logged once for all of them."""
+    logger = mock.Mock()
+    monkeypatch.setattr(resources, 'get_dagster_logger', lambda: logger)
+    bucket = RateLimitBucket(reserve=5)
+    reset_time = int(time.time()) + 1
+    bucket.update(make_response(headers=rate_limit_headers(limit=5000, remaining=5, reset_time=reset_time)))
+    assert not bucket.has_tokens()
+
+    threads = [threading.Thread(target=bucket.acquire) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert not any(thread.is_alive() for thread in threads)
+    assert time.time() >= reset_time
+    assert logger.warning.call_count == 1
+
+
+def test_not_modified_response_uses_cached_body_and_link(github_api, tmp_path):
+    """A `304 Not Modified` answer is turned into the cached response, including its pagination links."""
+    cache_dir = tmp_path / 'response_cache'
+    assert not cache_dir.exists()  # Created with the first cached response
+
+    body = orjson.dumps([{'number': 1, 'state': 'open'}])
+    link = '<https://api.github.com/repos/owner/repo/issues?page=2>; rel="next"'
+    session = github_api._get_session()
+    responses = [
+        make_response(headers={'ETag': '"abc"', 'Link': link}, body=body),
+        make_response(status_code=304, headers={'ETag': '"abc"'}, body=b''),
+    ]
+    with mock.patch.object(session, 'request', side_effect=responses) as request:
+        github_api.execute_request(method='GET', path='/repos/owner/repo/issues')
+        response = github_api.execute_request(method='GET', path='/repos/owner/repo/issues')
+
+    assert cache_dir.is_dir()
+    assert request.call_args.kwargs['headers']['If-None-Match'] == '"abc"'
+    assert response.status_code == 200
+    assert response.content == body
+    assert response.links['next']['url'] == 'https://api.github.com/repos/owner/repo/issues?page=2'
+
+
+def test_response_cache_is_scoped_to_the_tokens(monkeypatch, tmp_path):
+    """A response cached with one token is not revalidated or served for requests made with another token."""
+    monkeypatch.setenv('GITHUB_USE_MOCK', 'false')
+    cache_dir = str(tmp_path / 'response_cache')
+    requests_by_token = []
+    for token in ('first', 'second'):
+        github_api = GitHubAPIResource(github_token=token, retry_delay_seconds=0, response_cache_dir=cache_dir)
+        session = github_api._get_session()
+        with mock.patch.object(session, 'request', return_value=make_response(headers={'ETag': '"abc"'})) as request:
+            github_api.execute_request(method='GET', path='/repos/owner/private-repo')
+        requests_by_token.append(request.call_args.kwargs['headers'])
+
+    assert 'If-None-Match' not in requests_by_token[1]
+
+
+def test_response_cache_ignores_responses_without_validators(tmp_path):
+    """Responses without `ETag` or `Last-Modified` can't be revalidated, so they are not stored."""
+    cache = ResponseCache(str(tmp_path / 'response_cache'))
+    cache.set('GET', 'https://api.github.com/repos/owner/repo', {}, make_response(body=b'{}'))
+
+    assert cache.get('GET', 'https://api.github.com/repos/owner/repo', {}) is None
+
+
+def test_pages_are_yielded_in_order(github_api):
+    """Pages requested concurrently are yielded in page order, even if later pages are answered first."""
+    def execute_request(self, method, path, params=None, **kwargs):
+        page = params['page']
+        time.sleep(0.01 * (page % 5))  # Answer pages out of order
+        return make_response(body=orjson.dumps([{'page': page, 'item': index} for index in range(3)]))
+
+    with mock.patch.object(GitHubAPIResource, 'execute_request', execute_request):
+        items = list(github_api._get_pages(path='/repos/owner/repo/issues', params={}, pages=range(2, 21), workers=4))
+
+    assert [(item['page'], item['item']) for item in items] == [
+        (page, index) for page in range(2, 21) for index in range(3)
+    ]
+
+
+@pytest.fixture
+def github_api_with_tokens(monkeypatch) -> GitHubAPIResource:
+    """GitHub resource for the real API with two tokens and without retry delays."""
+    monkeypatch.setenv('GITHUB_USE_MOCK', 'false')
+    return GitHubAPIResource(github_tokens=['first', 'second'], retry_delay_seconds=0)
+
+
+def get_tokens(request: mock.Mock) -> list[str]:
+    """Get the tokens, which were sent with the requests of a mocked session."""
+    return [call.kwargs['headers']['Authorization'].removeprefix('Bearer ') for call in request.call_args_list]
+
+
+def test_tokens_are_used_round_robin(github_api_with_tokens):
+    """Requests use the tokens in turns."""
+    session = github_api_with_tokens._get_session()
+    headers = rate_limit_headers(limit=5000, remaining=4000, reset_time=int(time.time()) + 3600)
+    with mock.patch.object(session, 'request', return_value=make_response(headers=headers)) as request:
+        for _ in range(4):
+            github_api_with_tokens.execute_request(method='GET', path='/repos/owner/repo')
+
+    assert get_tokens(request) == ['first', 'second', 'first', 'second']
+
+
+def test_tokens_with_used_up_rate_limit_are_skipped(github_api_with_tokens):
+    """A token whose rate limit is used up is skipped until its window resets."""
+    session = github_api_with_tokens._get_session()
+    reset_time = int(time.time()) + 3600
+    responses = [
+        make_response(headers=rate_limit_headers(limit=5000, remaining=5, reset_time=reset_time)),
+        *(make_response(headers=rate_limit_headers(limit=5000, remaining=4000, reset_time=reset_time))
+          for _ in range(3)),
+    ]
+    with mock.patch.object(session, 'request', side_effect=responses) as request:
+        for _ in range(4):
+            github_api_with_tokens.execute_request(method='GET', path='/repos/owner/repo')
+
+    assert get_tokens(request) == ['first', 'second', 'second', 'second']
+
+
+def test_rest_and_graphql_have_separate_rate_limits(monkeypatch):
+    """A used up rate limit of the REST API doesn't hold back requests to the GraphQL API."""
+    monkeypatch.setenv('GITHUB_USE_MOCK', 'false')
+    github_api = GitHubAPIResource(github_token='token', retry_delay_seconds=0)
+    session = github_api._get_session()
+    headers = rate_limit_headers(limit=5000, remaining=5, reset_time=int(time.time()) + 3600)
+    with mock.patch.object(session, 'request', return_value=make_response(headers=headers, body=b'{}')):
+        github_api.execute_request(method='GET', path='/repos/owner/repo')
+        assert not github_api._has_available_token('/repos/owner/repo')
+        assert github_api._has_available_token('/graphql')
+        response = github_api.execute_request(method='POST', path='/graphql', json={'query': '{ viewer { login } }'})
+
+    assert response.status_code == 200
+    assert set(github_api._rate_limit_buckets) == {('token', 'core'), ('token', 'graphql')}
+
+
+def test_rate_limited_token_is_replaced_without_waiting(github_api_with_tokens, monkeypatch):
+    """When GitHub rejects a token because of its rate limit, the request is retried at once with another token."""
+    sleep = mock.Mock()
+    monkeypatch.setattr(resources.time, 'sleep', sleep)
+    session = github_api_with_tokens._get_session()
+    reset_time = int(time.time()) + 3600
+    responses = [
+        make_response(status_code=403, headers=rate_limit_headers(limit=5000, remaining=0, reset_time=reset_time)),
+        make_response(headers=rate_limit_headers(limit=5000, remaining=4000, reset_time=reset_time)),
+    ]
+    with mock.patch.object(session, 'request', side_effect=responses) as request:
+        response = github_api_with_tokens.execute_request(method='GET', path='/repos/owner/repo')
+
+    assert response.status_code == 200
+    assert get_tokens(request) == ['first', 'second']
+    sleep.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ('headers', 'expected_delay'),
+    [
+        ({'Retry-After': '30'}, 30),
+        ({}, 8),
+        ({'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'}, 8),  # HTTP-date values fall back to the default
+    ],
+)
+def test_retry_delay_honors_retry_after(monkeypatch, headers, expected_delay):
+    """A `Retry-After` in seconds wins over the default delay, which is used otherwise."""
+    monkeypatch.setattr(resources.random, 'uniform', lambda low, high: low)
+
+    delay = GitHubAPIResource._get_retry_delay(make_response(status_code=503, headers=headers), default=8)
+
+    assert delay == expected_delay
+
+
+@pytest.mark.parametrize('jitter', ['low', 'high'])
+def test_retry_delay_adds_bounded_jitter(monkeypatch, jitter):
+    """The jitter adds at most `RETRY_JITTER` of the delay."""
+    monkeypatch.setattr(resources.random, 'uniform', lambda low, high: low if jitter == 'low' else high)
+
+    delay = GitHubAPIResource._get_retry_delay(None, default=10)
+
+    assert delay == (10 if jitter == 'low' else 10 * (1 + resources.RETRY_JITTER))
+
+
+def test_server_errors_back_off_exponentially(monkeypatch):
+    """Server errors without `Retry-After` are retried after exponentially growing delays."""
+    monkeypatch.setenv('GITHUB_USE_MOCK', 'false')
+    monkeypatch.setattr(resources.random, 'uniform', lambda low, high: low)
+    sleep = mock.Mock()
+    monkeypatch.setattr(resources.time, 'sleep', sleep)
+    github_api = GitHubAPIResource(github_token='token', retry_delay_seconds=1, retry_attempts=3)
+    responses = [
+        *(make_response(status_code=502) for _ in range(3)),
+        make_response(status_code=503, headers={'Retry-After': '7'}),
+    ]
+    with mock.patch.object(github_api._get_session(), 'request', side_effect=responses):
+        with pytest.raises(requests.exceptions.RequestException, match='Max retries exceeded'):
+            github_api.execute_request(method='GET', path='/repos/owner/repo')
+
+    assert [call.args[0] for call in sleep.call_args_list] == [1, 2, 4, 7]
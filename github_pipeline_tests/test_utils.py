@@ -0,0 +1,69 @@
+from datetime import datetime, timezone
+from unittest import mock
+
+import pytest
+
+from github_pipeline.mock_github import MockGitHubAPI
+from github_pipeline.utils import count_items, create_markdown_report, summarize_items, validate_items
+
+
+def test_validate_items_parses_timestamps():
+    """Valid items are yielded with only the fields of the schema and parsed timestamps."""
+    items = [{'id': 1, 'tag_name': 'v1.0.0', 'created_at': '2023-01-01T00:00:00Z', 'body': 'ignored'}]
+
+    assert list(validate_items(items, section='releases')) == [
+        {'id': 1, 'tag_name': 'v1.0.0', 'created_at': datetime(2023, 1, 1, tzinfo=timezone.utc)}
+    ]
+
+
+def test_validate_items_rejects_timestamps_without_timezone():
+    """A naive timestamp is reported as an invalid item, instead of failing while the durations are summed up."""
+    items = [{'state': 'closed', 'created_at': '2023-01-01', 'closed_at': '2023-01-02T00:00:00Z'}]
+
+    with pytest.raises(ValueError, match="Item 0 of 'issues' is invalid"):
+        summarize_items(items, section='issues')
+
+
+def test_summarize_items_counts_and_averages_closed_items():
+    """Open and closed items are counted, and only closed items with `closed_at` are averaged."""
+    items = [
+        {'state': 'open', 'created_at': '2023-01-01T00:00:00Z', 'closed_at': None},
+        {'state': 'closed', 'created_at': '2023-01-01T00:00:00Z', 'closed_at': '2023-01-02T00:00:00Z'},
+        {'state': 'closed', 'created_at': '2023-01-01T00:00:00Z', 'closed_at': '2023-01-04T00:00:00+00:00'},
+        {'state': 'closed', 'created_at': '2023-01-01T00:00:00Z'},
+    ]
+
+    assert summarize_items(items, section='issues') == {'open': 1, 'closed': 3, 'avg_days_until_closed': 2.0}
+    assert summarize_items([], section='prs') == {'open': 0, 'closed': 0, 'avg_days_until_closed': 0.0}
+
+
+def test_malformed_mock_data_is_invalid():
+    """The deliberately malformed iceberg-python mock data fails the validation at its first item."""
+    mock_api = MockGitHubAPI()
+
+    with pytest.raises(ValueError, match="Item 0 of 'releases' is invalid"):
+        count_items(mock_api.get_releases('apache', 'iceberg-python'), section='releases')
+    with pytest.raises(ValueError, match="Item 0 of 'issues' is invalid"):
+        summarize_items(mock_api.get_issues('apache', 'iceberg-python'), section='issues')
+    assert count_items(mock_api.get_releases('delta-io', 'delta-rs'), section='releases') > 0
+
+
+def test_markdown_report_table():
+    """The report has one column per repository, with metrics aligned left, values right and empty missing cells."""
+    context = mock.Mock()
+    report_data = {
+        'delta-rs': {'stars': 2705, 'open_issues': 139},
+        'iceberg-python': {'stars': 695, 'releases': 12},
+    }
+
+    md_report = create_markdown_report(context, report_data)
+
+    assert md_report.splitlines() == [
+        '|             | delta-rs | iceberg-python |',
+        '|:------------|---------:|---------------:|',
+        '| stars       |     2705 |            695 |',
+        '| open_issues |      139 |                |',
+        '| releases    |          |             12 |',
+    ]
+    context.add_output_metadata.assert_called_once()
+    assert context.add_output_metadata.call_args.kwargs['metadata']['report'].md_str == md_report